@@ -3,8 +3,24 @@
 Configuration management for OpenAPI to Java generator.
 Loads configuration from config.yaml or creates default if not exists.
 """
+import collections
+import contextlib
+import functools
+import hashlib
+import json
+import logging
 import os
-import yaml
+import pickle
+import sys
+from typing import NamedTuple
+
+# Optional faster JSON parser for JSON definitions
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -34,90 +50,258 @@ DEFAULT_CONFIG = {
     'openapi_definitions_dir': 'openApiDefinitions'
 }
 
+# Serialized defaults; decoding is a cheaper deep copy than copy.deepcopy
+_DEFAULTS_TEMPLATE = json.dumps(DEFAULT_CONFIG)
+
+def _defaults_snapshot():
+    """Return a fresh, fully independent copy of DEFAULT_CONFIG."""
+    return json.loads(_DEFAULTS_TEMPLATE)
+
 CONFIG_FILE = 'config.yaml'
 
+# Values a freshly created config.yaml sets differently from DEFAULT_CONFIG, which
+# only fills in keys missing from an existing file
+_CREATED_CONFIG_OVERRIDES = {'java': {'enable_imports': True}}
+
+# Comment written at the top of a freshly generated config.yaml
+_CONFIG_HEADER = "# OpenAPI to Java Generator Configuration\n"
+
+# File extensions (lowercase, without the dot) recognised as OpenAPI definitions
+_DEFINITION_SUFFIXES = frozenset({'yaml', 'yml', 'json'})
+
+# Parsed configuration and the config.yaml mtime it was read at
+_config_cache = None
+_config_mtime = None
+
 def load_config():
-    """Load configuration from config.yaml or create default."""
-    if not os.path.exists(CONFIG_FILE):
+    """Load configuration from config.yaml or create default.
+
+    The parsed result is cached and only re-read when config.yaml changes on disk.
+    """
+    global _config_cache, _config_mtime
+
+    mtime = _config_file_mtime()
+    if mtime is None:
         print(f"⚙️  Creating default configuration file: {CONFIG_FILE}")
-        create_default_config()
+        created = create_default_config()
+        mtime = _config_file_mtime()
+        if created is None or mtime is None:
+            # Default file could not be written; fall back without caching
+            return _read_config()
+
+        # The file we just wrote holds exactly the defaults, no need to parse it back
+        _config_cache = created
+        _config_mtime = mtime
+        return _config_cache
+
+    if _config_cache is not None and mtime == _config_mtime:
+        return _config_cache
+
+    _config_cache = _read_config()
+    _config_mtime = mtime
+    return _config_cache
+
+def _config_file_mtime():
+    """Return the config.yaml mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def _merge_into(result, loaded):
+    """Deep merge loaded config into result in place."""
+    for key, value in loaded.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            _merge_into(result[key], value)
+        else:
+            result[key] = value
+
+def _yaml_loader():
+    """Return the fastest available safe YAML loader, importing PyYAML on first use."""
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    return yaml, getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def parse_yaml(data):
+    """Parse YAML text or bytes with the fastest available safe loader."""
+    yaml, loader = _yaml_loader()
+    return yaml.load(data, Loader=loader)
+
+def load_yaml_file(file_path):
+    """Parse a YAML file with the fastest available safe loader."""
+    # Read the whole file in one call and let libyaml handle the decoding
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    return parse_yaml(data)
+
+# Parsed specs keyed by a digest of the file contents, most recently used last
+_SPEC_CACHE_SIZE = 16
+_spec_cache = collections.OrderedDict()
+
+# On-disk cache of parsed specs shared between runs
+_SPEC_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'openapi2java')
+
+# Number of pickled specs kept on disk; older entries are pruned after each store
+_SPEC_CACHE_ENTRIES = 64
+
+@functools.lru_cache(maxsize=None)
+def _parser_tag():
+    """Describe the Python and parser versions a pickled spec was produced with."""
+    yaml, loader = _yaml_loader()
+    json_parser = f"orjson{orjson.__version__}" if orjson is not None else "json"
+    return f"py{sys.version_info[0]}.{sys.version_info[1]}-yaml{yaml.__version__}-{loader.__name__}-{json_parser}"
+
+def _load_cached_spec(cache_file):
+    """Return a previously pickled spec, or None if there is no usable cache entry."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or otherwise unreadable entries are simply re-parsed
+        return None
+
+def _store_cached_spec(cache_file, openapi_spec):
+    """Pickle a parsed spec for later runs; the cache is best effort."""
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_SPEC_CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(openapi_spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        # Unwritable cache, or a spec pickle cannot handle (e.g. too deeply nested)
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+        return
+    _prune_spec_cache()
+
+def _prune_spec_cache():
+    """Delete all but the _SPEC_CACHE_ENTRIES most recently written pickled specs."""
+    try:
+        with os.scandir(_SPEC_CACHE_DIR) as entries:
+            cached = [(entry.stat().st_mtime_ns, entry.path) for entry in entries
+                      if entry.name.endswith('.pkl') and entry.is_file()]
+    except OSError:
+        return
+    if len(cached) <= _SPEC_CACHE_ENTRIES:
+        return
+    cached.sort(reverse=True)
+    for _, path in cached[_SPEC_CACHE_ENTRIES:]:
+        # Another run may have removed it already
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+def _looks_like_json(data):
+    """Check whether a definition is a JSON document, judging by its first non-blank byte."""
+    return data.lstrip(b'\xef\xbb\xbf \t\r\n')[:1] == b'{'
+
+def _parse_json_spec(data):
+    """Parse a JSON definition, falling back to YAML for flow-style YAML that only looks like JSON."""
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError:
+        return parse_yaml(data)
+
+def load_openapi_spec(openapi_file):
+    """Load an OpenAPI definition, parsing JSON documents with a JSON parser rather than YAML.
+
+    Files with identical contents are only parsed once, within a run and across
+    runs through a pickle cache. The returned spec is shared between callers
+    and must not be modified.
+    """
+    with open(openapi_file, 'rb') as f:
+        data = f.read()
+
+    is_json = _looks_like_json(data)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    key = (digest, is_json)
+    openapi_spec = _spec_cache.get(key)
+    if openapi_spec is not None:
+        _spec_cache.move_to_end(key)
+        return openapi_spec
+
+    # The parser versions are part of the name, so an upgrade never serves an old parse
+    cache_file = os.path.join(_SPEC_CACHE_DIR, f"{digest}.{'json' if is_json else 'yaml'}.{_parser_tag()}.pkl")
+    openapi_spec = _load_cached_spec(cache_file)
+    if openapi_spec is None:
+        openapi_spec = _parse_json_spec(data) if is_json else parse_yaml(data)
+        _store_cached_spec(cache_file, openapi_spec)
+
+    _spec_cache[key] = openapi_spec
+    if len(_spec_cache) > _SPEC_CACHE_SIZE:
+        _spec_cache.popitem(last=False)
+    return openapi_spec
 
+def _read_config():
+    """Parse config.yaml and merge it with the defaults."""
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-            if config is None:
-                config = DEFAULT_CONFIG.copy()
-
-            # Merge with defaults to ensure all keys exist (deep merge for nested dicts)
-            def deep_merge(default, loaded):
-                """Deep merge loaded config with defaults."""
-                result = default.copy()
-                for key, value in loaded.items():
-                    if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                        result[key] = deep_merge(result[key], value)
-                    else:
-                        result[key] = value
-                return result
-
-            config = deep_merge(DEFAULT_CONFIG, config)
-            return config
+        config = load_yaml_file(CONFIG_FILE)
+        if config is None:
+            return _defaults_snapshot()
+
+        # Merge with defaults to ensure all keys exist (deep merge for nested dicts)
+        merged = _defaults_snapshot()
+        _merge_into(merged, config)
+        return merged
     except Exception as e:
-        print(f"⚠️  Error loading {CONFIG_FILE}: {e}")
-        print("Using default configuration...")
-        return DEFAULT_CONFIG.copy()
+        logger.warning("⚠️  Error loading %s: %s", CONFIG_FILE, e)
+        logger.warning("Using default configuration...")
+        return _defaults_snapshot()
 
 def create_default_config():
-    """Create default config.yaml file."""
-    config_content = """# OpenAPI to Java Generator Configuration
-
-json:
-  examples_folder: examples
-
-java:
-  base_package: com.java
-  java_folder: java
-  enable_javadoc: true
-  enable_imports: true
-  detect_package: true
-
-openapi_definitions_dir: openApiDefinitions
-
-feign:
-  base_package: com.java.client
-  feign_folder: feign
-  enable_javadoc: true
-  interface_suffix: Client
-  generate_config: true
-  grouping_strategy: single-client
-  use_response_entity: false
-  format_one_param_per_line: true
-  add_feign_annotation: true
-  ignore_optional_params: false
-  ignore_params_list: []
-"""
+    """Create default config.yaml file.
+
+    Returns:
+        The configuration dictionary written to disk, or None if writing failed.
+    """
+    import yaml
+    # Prefer the libyaml-backed emitter when PyYAML was built with it
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+    created = _defaults_snapshot()
+    _merge_into(created, _CREATED_CONFIG_OVERRIDES)
+
     try:
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            f.write(config_content)
+            f.write(_CONFIG_HEADER)
+            # Dump one top-level section at a time to keep them visually separated
+            for section, value in created.items():
+                f.write("\n")
+                yaml.dump({section: value}, f, Dumper=dumper, sort_keys=False, default_flow_style=False)
         print(f"✅ Created {CONFIG_FILE} with default values")
     except Exception as e:
-        print(f"❌ Error creating {CONFIG_FILE}: {e}")
+        logger.error("❌ Error creating %s: %s", CONFIG_FILE, e)
+        return None
+    return created
 
 def get_config():
     """Get configuration dictionary."""
     return load_config()
 
-def ensure_openapi_definitions_dir():
-    """Ensure openapi_definitions_dir exists, create with example if it doesn't."""
-    config = load_config()
-    openapi_dir = config.get('openapi_definitions_dir', 'openApiDefinitions')
+def ensure_openapi_definitions_dir(openapi_dir=None):
+    """Ensure openapi_definitions_dir exists, create with example if it doesn't.
 
-    if not os.path.exists(openapi_dir):
-        print(f"📁 Creating OpenAPI definitions directory: {openapi_dir}")
-        os.makedirs(openapi_dir, exist_ok=True)
+    Args:
+        openapi_dir: Directory to ensure; read from the configuration when None
+    """
+    if openapi_dir is None:
+        openapi_dir = load_config().get('openapi_definitions_dir', 'openApiDefinitions')
 
-        # Create example file
-        example_file = os.path.join(openapi_dir, 'example-api.yaml')
-        example_content = """openapi: 3.0.1
+    try:
+        os.makedirs(openapi_dir)
+    except FileExistsError:
+        return openapi_dir
+
+    print(f"📁 Creating OpenAPI definitions directory: {openapi_dir}")
+
+    # Create example file
+    example_file = os.path.join(openapi_dir, 'example-api.yaml')
+    example_content = """openapi: 3.0.1
 info:
   title: Example API
   description: Example OpenAPI specification
@@ -144,40 +328,65 @@ components:
         message:
           type: string
 """
-        with open(example_file, 'w', encoding='utf-8') as f:
-            f.write(example_content)
+    with open(example_file, 'w', encoding='utf-8') as f:
+        f.write(example_content)
 
-        print(f"   ✅ Created example file: {example_file}")
-        print(f"   ℹ️  Add your OpenAPI YAML files to {openapi_dir} directory")
+    print(f"   ✅ Created example file: {example_file}")
+    print(f"   ℹ️  Add your OpenAPI YAML files to {openapi_dir} directory")
 
     return openapi_dir
 
 def get_openapi_definition_files():
     """Get list of OpenAPI definition files to process from openapi_definitions_dir."""
     config = load_config()
-    openapi_dir = ensure_openapi_definitions_dir()
-    yaml_files = []
+    openapi_dir = ensure_openapi_definitions_dir(config.get('openapi_definitions_dir', 'openApiDefinitions'))
+    definition_files = []
 
-    for filename in os.listdir(openapi_dir):
-        if filename.endswith('.yaml') or filename.endswith('.yml'):
-            file_path = os.path.join(openapi_dir, filename)
-            # Use filename without extension as identifier
-            name = os.path.splitext(filename)[0]
-            yaml_files.append((name, file_path))
+    with os.scandir(openapi_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            dot = filename.rfind('.')
+            if dot > 0 and filename[dot + 1:].lower() in _DEFINITION_SUFFIXES and entry.is_file():
+                # Use filename without extension as identifier
+                definition_files.append((filename[:dot], entry.path))
 
-    if not yaml_files:
-        print(f"⚠️  No YAML files found in {openapi_dir}")
+    if not definition_files:
+        logger.warning("⚠️  No OpenAPI definition files found in %s", openapi_dir)
 
-    return sorted(yaml_files)
+    # Sort in place; nothing to order for zero or one definition
+    if len(definition_files) > 1:
+        definition_files.sort()
+    return definition_files
 
-# Load configuration when module is imported
-_config = load_config()
+class JavaConfig(NamedTuple):
+    """Immutable view of the 'java' configuration section."""
+    base_package: str
+    java_folder: str
+    enable_javadoc: bool
+    enable_imports: bool
+    detect_package: bool
 
-# Export configuration values for backward compatibility
-BASE_PACKAGE = _config['java']['base_package']
-JAVA_FOLDER = _config['java']['java_folder']
-EXAMPLES_FOLDER = _config['json']['examples_folder']
-ENABLE_JAVADOC = _config['java']['enable_javadoc']
-ENABLE_IMPORTS = _config['java']['enable_imports']
-DETECT_PACKAGE = _config['java']['detect_package']
+# Configuration values exported for backward compatibility, resolved lazily
+# so that importing this module does not read config.yaml
+_EXPORTS = {
+    'BASE_PACKAGE': ('java', 'base_package'),
+    'JAVA_FOLDER': ('java', 'java_folder'),
+    'EXAMPLES_FOLDER': ('json', 'examples_folder'),
+    'ENABLE_JAVADOC': ('java', 'enable_javadoc'),
+    'ENABLE_IMPORTS': ('java', 'enable_imports'),
+    'DETECT_PACKAGE': ('java', 'detect_package'),
+}
+
+def __getattr__(name):
+    """Resolve exported configuration constants on first access (PEP 562)."""
+    if name not in _EXPORTS and name != 'JAVA_CONFIG':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    # Materialize every export in one pass; later lookups hit the module globals
+    # directly and never come back through __getattr__
+    config = load_config()
+    exported = {export: config[section][key] for export, (section, key) in _EXPORTS.items()}
+    java = config['java']
+    exported['JAVA_CONFIG'] = JavaConfig._make(java[field] for field in JavaConfig._fields)
+    globals().update(exported)
+    return exported[name]
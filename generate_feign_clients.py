@@ -3,97 +3,69 @@
 Generate Feign Client interfaces from OpenAPI specification.
 Creates Spring Cloud OpenFeign clients for all endpoints defined in the OpenAPI spec.
 """
+import argparse
+import collections
+import contextlib
+import functools
+import hashlib
+import io
+import json
 import os
-import yaml
-import re
-from config import get_config
-
-def to_java_class_name(name):
-    """Convert string to Java class name."""
-    if re.match(r'^[A-Z][a-zA-Z0-9]*$', name):
-        return name
-    if re.match(r'^[a-z][a-zA-Z0-9]*$', name):
-        return name[0].upper() + name[1:]
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-    parts = re.split(r'[_\s-]+', name)
-    return ''.join(word.capitalize() for word in parts if word)
-
-def to_java_method_name(operation_id):
-    """Convert operationId to Java method name."""
-    if not operation_id:
-        return "execute"
-    # If already in camelCase, keep it
-    if re.match(r'^[a-z][a-zA-Z0-9]*$', operation_id):
-        return operation_id
-    # Convert to camelCase
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', operation_id)
-    parts = re.split(r'[_\s-]+', name)
-    if not parts:
-        return operation_id
-    return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:] if word)
-
-def to_java_param_name(name):
-    """Convert parameter name to valid Java identifier (camelCase), preserving internal camelCase."""
-    if not name:
-        return "param"
-    # If already valid camelCase, keep it
-    if re.match(r'^[a-z][a-zA-Z0-9]*$', name):
-        return name
-
-    # Split by hyphens, underscores, and spaces while preserving camelCase within parts
-    # First replace hyphens and spaces with underscores for uniform splitting
-    name = name.replace('-', '_').replace(' ', '_')
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-    parts = [part for part in name.split('_') if part]
-
-    if not parts:
-        return "param"
-
-    # First part should be lowercase, rest should preserve their camelCase or capitalize if all lowercase
-    result_parts = []
-    for i, part in enumerate(parts):
-        if i == 0:
-            # First part: convert to lowercase
-            result_parts.append(part.lower())
-        else:
-            # Subsequent parts: preserve if already has uppercase (camelCase), otherwise capitalize first letter
-            if any(c.isupper() for c in part):
-                # Has uppercase letters - preserve as is (e.g., "applicationId" stays "applicationId")
-                # But ensure first letter is uppercase for concatenation
-                result_parts.append(part[0].upper() + part[1:] if part else '')
-            else:
-                # All lowercase - capitalize first letter
-                result_parts.append(part.capitalize())
-
-    return ''.join(result_parts)
+import string
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from config import get_config, load_openapi_spec
+from name_utils import to_java_class_name, to_java_method_name, to_java_param_name
+
+# Spring mapping annotation for each supported HTTP method
+_MAPPING = {
+    'get': 'GetMapping',
+    'post': 'PostMapping',
+    'put': 'PutMapping',
+    'delete': 'DeleteMapping',
+    'patch': 'PatchMapping',
+}
+
+# Java type for each OpenAPI primitive type
+_PRIMITIVE_TYPES = {
+    'string': 'String',
+    'integer': 'Integer',
+    'number': 'Double',
+    'boolean': 'Boolean',
+    'object': 'Object'
+}
+
+# Spring parameter annotation template for each (location, required) pair
+_PARAM_ANNOTATIONS = {
+    ('path', True): '@PathVariable("%s")',
+    ('path', False): '@PathVariable("%s")',
+    ('query', True): '@RequestParam("%s")',
+    ('query', False): '@RequestParam(value = "%s", required = false)',
+    ('header', True): '@RequestHeader("%s")',
+    ('header', False): '@RequestHeader(value = "%s", required = false)',
+}
 
 def get_java_type_from_schema(schema, schemas, components):
     """Determine Java type from schema reference or inline schema."""
+    global _ref_type_cache_schemas
+    # Fast path for the common bare {'type': ...} primitive schema
+    if len(schema) == 1:
+        java_type = _PRIMITIVE_TYPES.get(schema.get('type'))
+        if java_type is not None:
+            return java_type
+
     if '$ref' in schema:
-        ref_path = schema['$ref'].split('/')
-        if ref_path[-2] == 'schemas':
-            schema_name = ref_path[-1]
-            class_name = to_java_class_name(schema_name)
-
-            # Check if the referenced schema is actually an array type
-            if schema_name in schemas:
-                actual_schema = schemas[schema_name]
-
-                # If it's an array schema without properties, use List<ItemType> instead
-                if (actual_schema.get('type') == 'array' and
-                    'properties' not in actual_schema and
-                    'allOf' not in actual_schema and
-                    'items' in actual_schema):
-                    item_type = get_java_type_from_schema(actual_schema['items'], schemas, components)
-                    return f"List<{item_type}>"
-
-                # Check if this schema has oneOf fields and needs generic definition
-                if has_oneof_property(actual_schema):
-                    base_class = get_oneof_base_class_name(actual_schema)
-                    if base_class:
-                        return f"{class_name}<? extends {base_class}>"
-
-            return class_name
+        # A $ref always maps to the same Java type within one spec, so resolve
+        # each distinct ref once and serve repeats from the cache
+        ref = schema['$ref']
+        if schemas is not _ref_type_cache_schemas:
+            _ref_type_cache.clear()
+            _ref_type_cache_schemas = schemas
+        if ref in _ref_type_cache:
+            java_type = _ref_type_cache[ref]
+        else:
+            java_type = _ref_type_cache[ref] = _java_type_for_ref(ref, schemas, components)
+        if java_type is not None:
+            return java_type
         # Note: parameter refs are handled below by looking at their schema
 
     schema_type = schema.get('type', 'object')
@@ -112,62 +84,113 @@ def get_java_type_from_schema(schema, schemas, components):
         elif schema_format == 'date-time':
             return 'LocalDateTime'
 
-    type_mapping = {
-        'string': 'String',
-        'integer': 'Integer',
-        'number': 'Double',
-        'boolean': 'Boolean',
-        'object': 'Object'
-    }
+    return _PRIMITIVE_TYPES.get(schema_type, 'Object')
 
-    return type_mapping.get(schema_type, 'Object')
+def _java_type_for_ref(ref, schemas, components):
+    """Resolve the Java type a schema $ref points to, or None if it is not a schema ref."""
+    ref_path = ref.split('/')
+    if ref_path[-2] != 'schemas':
+        return None
 
-def has_oneof_property(schema):
-    """Check if schema has any property with oneOf, including in allOf."""
-    # Check direct properties
-    properties = schema.get('properties', {})
-    for prop_schema in properties.values():
-        if 'oneOf' in prop_schema:
-            return True
+    schema_name = ref_path[-1]
+    class_name = to_java_class_name(schema_name)
 
-    # Check allOf items
-    if 'allOf' in schema:
-        for item in schema['allOf']:
-            # If it's an inline object with properties
-            if isinstance(item, dict) and 'properties' in item:
-                for prop_schema in item['properties'].values():
-                    if 'oneOf' in prop_schema:
-                        return True
+    # Check if the referenced schema is actually an array type
+    if schema_name in schemas:
+        actual_schema = schemas[schema_name]
 
-    return False
+        # If it's an array schema without properties, use List<ItemType> instead
+        if (actual_schema.get('type') == 'array' and
+            'properties' not in actual_schema and
+            'allOf' not in actual_schema and
+            'items' in actual_schema):
+            item_type = get_java_type_from_schema(actual_schema['items'], schemas, components)
+            return f"List<{item_type}>"
+
+        # Check if this schema has oneOf fields and needs generic definition
+        if has_oneof_property(actual_schema):
+            base_class = get_oneof_base_class_name(actual_schema)
+            if base_class:
+                return f"{class_name}<? extends {base_class}>"
+
+    return class_name
+
+# oneOf analysis per schema object, keyed by id(); the schema itself is stored
+# alongside the result so the id cannot be reused while the entry is alive
+_oneof_cache = {}
+
+# Resolved $refs for the spec currently being processed
+_ref_cache = {}
+_ref_cache_spec = None
+
+# Java type per schema $ref, for the schemas mapping it was resolved against
+_ref_type_cache = {}
+_ref_type_cache_schemas = None
+
+def _reset_spec_caches():
+    """Drop cached analyses from a previously processed spec."""
+    global _ref_cache_spec, _ref_type_cache_schemas
+    _oneof_cache.clear()
+    _ref_cache.clear()
+    _ref_cache_spec = None
+    _ref_type_cache.clear()
+    _ref_type_cache_schemas = None
+
+def _find_oneof_base_class(schema):
+    """Return the Java base class of the first oneOf property (direct or in allOf), or None."""
+    key = id(schema)
+    cached = _oneof_cache.get(key)
+    if cached is not None:
+        return cached[1]
+
+    base_class = None
 
-def get_oneof_base_class_name(schema):
-    """Get the base class name from the first oneOf property found, including in allOf."""
     # Check direct properties
     properties = schema.get('properties', {})
     for prop_name, prop_schema in properties.items():
         if 'oneOf' in prop_schema:
-            return to_java_class_name(prop_name)
+            base_class = to_java_class_name(prop_name)
+            break
 
     # Check allOf items
-    if 'allOf' in schema:
+    if base_class is None and 'allOf' in schema:
         for item in schema['allOf']:
             # If it's an inline object with properties
             if isinstance(item, dict) and 'properties' in item:
                 for prop_name, prop_schema in item['properties'].items():
                     if 'oneOf' in prop_schema:
-                        return to_java_class_name(prop_name)
+                        base_class = to_java_class_name(prop_name)
+                        break
+            if base_class is not None:
+                break
 
-    return None
+    _oneof_cache[key] = (schema, base_class)
+    return base_class
+
+def has_oneof_property(schema):
+    """Check if schema has any property with oneOf, including in allOf."""
+    return _find_oneof_base_class(schema) is not None
+
+def get_oneof_base_class_name(schema):
+    """Get the base class name from the first oneOf property found, including in allOf."""
+    return _find_oneof_base_class(schema)
 
 def resolve_ref(ref, openapi_spec):
     """Resolve a $ref to its actual value in the OpenAPI spec."""
+    global _ref_cache_spec
+    if openapi_spec is not _ref_cache_spec:
+        _ref_cache.clear()
+        _ref_cache_spec = openapi_spec
+    elif ref in _ref_cache:
+        return _ref_cache[ref]
+
     parts = ref.split('/')
     result = openapi_spec
     for part in parts:
         if part == '#':
             continue
         result = result.get(part, {})
+    _ref_cache[ref] = result
     return result
 
 def get_parameter_info(param_or_ref, openapi_spec):
@@ -198,22 +221,33 @@ def get_response_type(responses, schemas, components):
 
     return 'void'
 
-def generate_javadoc(summary, description, parameters=None, return_type=None, openapi_spec=None):
-    """Generate JavaDoc comment."""
-    lines = ["/**"]
+# Stands for an operation without an operationId key; an explicit null is kept
+# as None and, like any empty operationId, becomes 'execute'
+_NO_OPERATION_ID = object()
+
+@functools.lru_cache(maxsize=None)
+def method_name_for(operation_id, http_method, path):
+    """Get the Java method name for an operation, deriving one from method and path without an operationId."""
+    if operation_id is _NO_OPERATION_ID:
+        operation_id = f"{http_method}_{path.replace('/', '_')}"
+    return to_java_method_name(operation_id)
+
+def emit_javadoc(lines, indent, summary, description, parameters=None, return_type=None, openapi_spec=None):
+    """Append a JavaDoc comment to lines, each line prefixed with indent."""
+    lines.append(f"{indent}/**")
 
     if summary:
-        lines.append(f" * {summary}")
+        lines.append(f"{indent} * {summary}")
 
     if description and description != summary:
-        lines.append(" *")
+        lines.append(f"{indent} *")
         # Split long descriptions
         for line in description.split('\n'):
             if line.strip():
-                lines.append(f" * {line.strip()}")
+                lines.append(f"{indent} * {line.strip()}")
 
     if parameters:
-        lines.append(" *")
+        lines.append(f"{indent} *")
         for param_info in parameters:
             if isinstance(param_info, dict):
                 param = param_info
@@ -224,15 +258,18 @@ def generate_javadoc(summary, description, parameters=None, return_type=None, op
             param_java_name = to_java_param_name(param_name)  # Convert to valid Java identifier
             param_desc = param.get('description', '')
             if param_desc:
-                lines.append(f" * @param {param_java_name} {param_desc}")
+                lines.append(f"{indent} * @param {param_java_name} {param_desc}")
             else:
-                lines.append(f" * @param {param_java_name}")
+                lines.append(f"{indent} * @param {param_java_name}")
 
     if return_type and return_type != 'void':
-        lines.append(f" * @return {return_type}")
+        lines.append(f"{indent} * @return {return_type}")
 
-    lines.append(" */")
-    return '\n'.join(lines)
+    lines.append(f"{indent} */")
+
+def param_annotation(param_in, required, param_name):
+    """Get the Spring annotation for a parameter based on its location."""
+    return _PARAM_ANNOTATIONS.get((param_in, required), '@RequestParam("%s")') % param_name
 
 def get_request_body_type(request_body, schemas, components):
     """Get the Java type for request body."""
@@ -253,8 +290,51 @@ def get_request_body_type(request_body, schemas, components):
 
     return None
 
-def generate_feign_client(tag, paths_by_tag, openapi_spec, config):
-    """Generate a Feign client interface for a specific tag."""
+def _type_import_flags(java_types):
+    """Return (has_lists, has_local_date, has_local_date_time) for the given Java types."""
+    # Search all types at once rather than testing each one separately
+    joined = ' '.join(java_types)
+    has_lists = 'List<' in joined
+    has_local_date_time = 'LocalDateTime' in joined
+    if has_local_date_time:
+        joined = joined.replace('LocalDateTime', '')
+    has_local_date = 'LocalDate' in joined
+    return has_lists, has_local_date, has_local_date_time
+
+# Every import a generated client can need, already in sorted order
+_CLIENT_IMPORTS = (
+    "java.time.LocalDate",
+    "java.time.LocalDateTime",
+    "java.util.List",
+    "org.springframework.cloud.openfeign.FeignClient",
+    "org.springframework.http.ResponseEntity",
+    "org.springframework.web.bind.annotation.*",
+)
+
+def _client_import_lines(has_local_date, has_local_date_time, has_lists, add_feign_annotation, use_response_entity):
+    """Build the import statements of a client interface in sorted order."""
+    needed = (has_local_date, has_local_date_time, has_lists, add_feign_annotation, use_response_entity, True)
+    return [f"import {imp};" for imp, used in zip(_CLIENT_IMPORTS, needed) if used]
+
+def _emit_single_line_signature(lines, return_type, method_name, method_params):
+    """Append a method signature with all parameters on one line."""
+    params_str = ', '.join(method_params)
+    lines.append(f"    {return_type} {method_name}({params_str});")
+
+def _emit_multi_line_signature(lines, return_type, method_name, method_params):
+    """Append a method signature with one parameter per line."""
+    if not method_params:
+        _emit_single_line_signature(lines, return_type, method_name, method_params)
+        return
+
+    lines.append(f"    {return_type} {method_name}(")
+    for param in method_params[:-1]:
+        lines.append(f"        {param},")
+    lines.append(f"        {method_params[-1]}")
+    lines.append("    );")
+
+def generate_feign_client(tag, operations, openapi_spec, config, out):
+    """Generate a Feign client interface for a specific tag, writing it to out."""
     base_package = config['feign']['base_package']
     enable_javadoc = config['feign']['enable_javadoc']
     interface_suffix = config['feign']['interface_suffix']
@@ -262,81 +342,97 @@ def generate_feign_client(tag, paths_by_tag, openapi_spec, config):
     format_one_param_per_line = config['feign'].get('format_one_param_per_line', True)
     add_feign_annotation = config['feign'].get('add_feign_annotation', True)
     ignore_optional_params = config['feign'].get('ignore_optional_params', False)
-    ignore_params_list = config['feign'].get('ignore_params_list', [])
+    ignore_params = frozenset(config['feign'].get('ignore_params_list', []))
 
     schemas = openapi_spec.get('components', {}).get('schemas', {})
     components = openapi_spec.get('components', {})
 
+    # Pick the signature layout once instead of per method
+    emit_signature = _emit_multi_line_signature if format_one_param_per_line else _emit_single_line_signature
+
     # Generate class name from tag
     client_name = to_java_class_name(tag) + interface_suffix
 
-    # Start building the interface
-    lines = []
-    lines.append(f"package {base_package};")
-    lines.append("")
+    # Emit the method declarations first; the imports they need are only
+    # known once every parameter, request and response type has been resolved
+    body_lines = []
+    used_types = []
 
-    # Imports
-    imports = set([
-        "org.springframework.web.bind.annotation.*"
-    ])
+    # Generate methods for each operation
+    for path, http_method, operation in operations:
+        method_name = method_name_for(operation.get('operationId', _NO_OPERATION_ID), http_method, path)
 
-    # Only add FeignClient import if annotation is enabled
-    if add_feign_annotation:
-        imports.add("org.springframework.cloud.openfeign.FeignClient")
+        summary = operation.get('summary', '')
+        description = operation.get('description', '')
+
+        # Get parameters
+        params = []
+        method_params = []
+
+        for param_or_ref in operation.get('parameters', []):
+            param = get_parameter_info(param_or_ref, openapi_spec)
+            param_name = param.get('name', 'unknown')
+            param_java_name = to_java_param_name(param_name)  # Convert to valid Java identifier
+            param_in = param.get('in', 'query')
+            required = param.get('required', False)
+            param_schema = param.get('schema', {})
+            param_type = get_java_type_from_schema(param_schema, schemas, components)
+            used_types.append(param_type)
+
+            # Skip parameter if it should be ignored
+            if param_name in ignore_params:
+                continue
+
+            # Skip optional parameters if configured to ignore them
+            if ignore_optional_params and not required:
+                continue
+
+            params.append(param)
+
+            # Create parameter annotation
+            annotation = param_annotation(param_in, bool(required), param_name)
+            method_params.append(' '.join((annotation, param_type, param_java_name)))
 
-    # Only import ResponseEntity if needed
-    if use_response_entity:
-        imports.add("org.springframework.http.ResponseEntity")
+        # Check for request body
+        request_body = operation.get('requestBody')
+        request_body_type = get_request_body_type(request_body, schemas, components)
+
+        if request_body_type:
+            used_types.append(request_body_type)
+            method_params.append(f"@RequestBody {request_body_type} body")
+
+        # Get response type
+        response_type = get_response_type(operation.get('responses', {}), schemas, components)
+        used_types.append(response_type)
+        if use_response_entity:
+            return_type = f"ResponseEntity<{response_type}>" if response_type != 'void' else "ResponseEntity<Void>"
+        else:
+            return_type = response_type
+
+        # Generate JavaDoc
+        if enable_javadoc:
+            emit_javadoc(body_lines, '    ', summary, description, params, response_type, openapi_spec)
+
+        # Generate mapping annotation
+        mapping = _MAPPING.get(http_method.lower(), 'RequestMapping')
+
+        body_lines.append(f'    @{mapping}("{path}")')
+
+        # Generate method signature
+        emit_signature(body_lines, return_type, method_name, method_params)
+        body_lines.append("")
 
     # Check if we need List, LocalDate, or LocalDateTime imports
-    has_lists = False
-    has_local_date = False
-    has_local_date_time = False
+    has_lists, has_local_date, has_local_date_time = _type_import_flags(used_types)
 
-    for path, methods in paths_by_tag:
-        for method, operation in methods.items():
-            # Check parameters
-            for param_or_ref in operation.get('parameters', []):
-                param = get_parameter_info(param_or_ref, openapi_spec)
-                schema = param.get('schema', {})
-                param_type = get_java_type_from_schema(schema, schemas, components)
-
-                if schema.get('type') == 'array':
-                    has_lists = True
-                if 'LocalDate' in param_type and 'LocalDateTime' not in param_type:
-                    has_local_date = True
-                if 'LocalDateTime' in param_type:
-                    has_local_date_time = True
-
-            # Check request body
-            request_body_type = get_request_body_type(operation.get('requestBody'), schemas, components)
-            if request_body_type:
-                if 'List<' in str(request_body_type):
-                    has_lists = True
-                if 'LocalDate' in str(request_body_type) and 'LocalDateTime' not in str(request_body_type):
-                    has_local_date = True
-                if 'LocalDateTime' in str(request_body_type):
-                    has_local_date_time = True
-
-            # Check response
-            response_type = get_response_type(operation.get('responses', {}), schemas, components)
-            if response_type:
-                if 'List<' in str(response_type):
-                    has_lists = True
-                if 'LocalDate' in str(response_type) and 'LocalDateTime' not in str(response_type):
-                    has_local_date = True
-                if 'LocalDateTime' in str(response_type):
-                    has_local_date_time = True
-
-    if has_lists:
-        imports.add("java.util.List")
-    if has_local_date:
-        imports.add("java.time.LocalDate")
-    if has_local_date_time:
-        imports.add("java.time.LocalDateTime")
+    # Start building the interface
+    lines = []
+    lines.append(f"package {base_package};")
+    lines.append("")
 
-    for imp in sorted(imports):
-        lines.append(f"import {imp};")
+    # Imports (FeignClient only if the annotation is enabled, ResponseEntity only if needed)
+    lines.extend(_client_import_lines(has_local_date, has_local_date_time, has_lists,
+                                      add_feign_annotation, use_response_entity))
 
     lines.append("")
 
@@ -361,115 +457,13 @@ def generate_feign_client(tag, paths_by_tag, openapi_spec, config):
     lines.append(f"public interface {client_name} {{")
     lines.append("")
 
-    # Generate methods for each operation
-    for path, methods in paths_by_tag:
-        for http_method, operation in methods.items():
-            operation_id = operation.get('operationId', f"{http_method}_{path.replace('/', '_')}")
-            method_name = to_java_method_name(operation_id)
-
-            summary = operation.get('summary', '')
-            description = operation.get('description', '')
-
-            # Get parameters
-            params = []
-            method_params = []
-
-            for param_or_ref in operation.get('parameters', []):
-                param = get_parameter_info(param_or_ref, openapi_spec)
-                param_name = param.get('name', 'unknown')
-                param_java_name = to_java_param_name(param_name)  # Convert to valid Java identifier
-                param_in = param.get('in', 'query')
-                required = param.get('required', False)
-                param_schema = param.get('schema', {})
-                param_type = get_java_type_from_schema(param_schema, schemas, components)
-
-                # Skip parameter if it should be ignored
-                if param_name in ignore_params_list:
-                    continue
-
-                # Skip optional parameters if configured to ignore them
-                if ignore_optional_params and not required:
-                    continue
-
-                params.append(param)
-
-                # Create parameter annotation
-                if param_in == 'path':
-                    annotation = f'@PathVariable("{param_name}")'
-                elif param_in == 'query':
-                    if required:
-                        annotation = f'@RequestParam("{param_name}")'
-                    else:
-                        annotation = f'@RequestParam(value = "{param_name}", required = false)'
-                elif param_in == 'header':
-                    if required:
-                        annotation = f'@RequestHeader("{param_name}")'
-                    else:
-                        annotation = f'@RequestHeader(value = "{param_name}", required = false)'
-                else:
-                    annotation = f'@RequestParam("{param_name}")'
-
-                method_params.append(f"{annotation} {param_type} {param_java_name}")
-
-            # Check for request body
-            request_body = operation.get('requestBody')
-            request_body_type = get_request_body_type(request_body, schemas, components)
-
-            if request_body_type:
-                method_params.append(f"@RequestBody {request_body_type} body")
-
-            # Get response type
-            response_type = get_response_type(operation.get('responses', {}), schemas, components)
-            if use_response_entity:
-                return_type = f"ResponseEntity<{response_type}>" if response_type != 'void' else "ResponseEntity<Void>"
-            else:
-                return_type = response_type
-
-            # Generate JavaDoc
-            if enable_javadoc:
-                javadoc = generate_javadoc(summary, description, params, response_type, openapi_spec)
-                for line in javadoc.split('\n'):
-                    lines.append(f"    {line}")
-
-            # Generate mapping annotation
-            mapping_method = http_method.lower().capitalize()
-            if mapping_method == 'Get':
-                mapping = 'GetMapping'
-            elif mapping_method == 'Post':
-                mapping = 'PostMapping'
-            elif mapping_method == 'Put':
-                mapping = 'PutMapping'
-            elif mapping_method == 'Delete':
-                mapping = 'DeleteMapping'
-            elif mapping_method == 'Patch':
-                mapping = 'PatchMapping'
-            else:
-                mapping = 'RequestMapping'
-
-            lines.append(f'    @{mapping}("{path}")')
-
-            # Generate method signature
-            if format_one_param_per_line and len(method_params) > 0:
-                # Format with one parameter per line
-                lines.append(f"    {return_type} {method_name}(")
-                for i, param in enumerate(method_params):
-                    if i < len(method_params) - 1:
-                        lines.append(f"        {param},")
-                    else:
-                        lines.append(f"        {param}")
-                lines.append("    );")
-            else:
-                # Single line format
-                params_str = ', '.join(method_params)
-                lines.append(f"    {return_type} {method_name}({params_str});")
-            lines.append("")
-
+    # Write the header, the method declarations and the closing brace in one call
+    lines.extend(body_lines)
     lines.append("}")
+    out.write("\n".join(lines))
 
-    return '\n'.join(lines)
-
-def generate_single_api_client(all_paths, openapi_spec, config):
-    """Generate a single Feign client interface for the entire API."""
+def generate_single_api_client(all_paths, openapi_spec, config, out):
+    """Generate a single Feign client interface for the entire API, writing it to out."""
     base_package = config['feign']['base_package']
     enable_javadoc = config['feign']['enable_javadoc']
     interface_suffix = config['feign']['interface_suffix']
@@ -477,11 +471,14 @@ def generate_single_api_client(all_paths, openapi_spec, config):
     format_one_param_per_line = config['feign'].get('format_one_param_per_line', True)
     add_feign_annotation = config['feign'].get('add_feign_annotation', True)
     ignore_optional_params = config['feign'].get('ignore_optional_params', False)
-    ignore_params_list = config['feign'].get('ignore_params_list', [])
+    ignore_params = frozenset(config['feign'].get('ignore_params_list', []))
 
     schemas = openapi_spec.get('components', {}).get('schemas', {})
     components = openapi_spec.get('components', {})
 
+    # Pick the signature layout once instead of per method
+    emit_signature = _emit_multi_line_signature if format_one_param_per_line else _emit_single_line_signature
+
     # Generate class name from API title
     api_title = openapi_spec.get('info', {}).get('title', 'Api')
     client_name = to_java_class_name(api_title.replace(' ', '')) + interface_suffix
@@ -501,113 +498,23 @@ def generate_single_api_client(all_paths, openapi_spec, config):
                     operations_by_tag[tag] = []
                 operations_by_tag[tag].append((path, method, operation))
 
-    # Start building the interface
-    lines = []
-    lines.append(f"package {base_package};")
-    lines.append("")
-
-    # Imports
-    imports = set([
-        "org.springframework.web.bind.annotation.*"
-    ])
-
-    # Only add FeignClient import if annotation is enabled
-    if add_feign_annotation:
-        imports.add("org.springframework.cloud.openfeign.FeignClient")
-
-    # Only import ResponseEntity if needed
-    if use_response_entity:
-        imports.add("org.springframework.http.ResponseEntity")
-
-    # Check if we need List, LocalDate, or LocalDateTime imports
-    has_lists = False
-    has_local_date = False
-    has_local_date_time = False
-
-    for path, path_item in all_paths:
-        for method in ['get', 'post', 'put', 'delete', 'patch']:
-            if method not in path_item:
-                continue
-            operation = path_item[method]
-
-            # Check parameters
-            for param_or_ref in operation.get('parameters', []):
-                param = get_parameter_info(param_or_ref, openapi_spec)
-                schema = param.get('schema', {})
-                param_type = get_java_type_from_schema(schema, schemas, components)
-
-                if schema.get('type') == 'array':
-                    has_lists = True
-                if 'LocalDate' in param_type and 'LocalDateTime' not in param_type:
-                    has_local_date = True
-                if 'LocalDateTime' in param_type:
-                    has_local_date_time = True
-
-            # Check request body
-            request_body_type = get_request_body_type(operation.get('requestBody'), schemas, components)
-            if request_body_type:
-                if 'List<' in str(request_body_type):
-                    has_lists = True
-                if 'LocalDate' in str(request_body_type) and 'LocalDateTime' not in str(request_body_type):
-                    has_local_date = True
-                if 'LocalDateTime' in str(request_body_type):
-                    has_local_date_time = True
-
-            # Check response
-            response_type = get_response_type(operation.get('responses', {}), schemas, components)
-            if response_type:
-                if 'List<' in str(response_type):
-                    has_lists = True
-                if 'LocalDate' in str(response_type) and 'LocalDateTime' not in str(response_type):
-                    has_local_date = True
-                if 'LocalDateTime' in str(response_type):
-                    has_local_date_time = True
-
-    if has_lists:
-        imports.add("java.util.List")
-    if has_local_date:
-        imports.add("java.time.LocalDate")
-    if has_local_date_time:
-        imports.add("java.time.LocalDateTime")
-
-    for imp in sorted(imports):
-        lines.append(f"import {imp};")
-
-    lines.append("")
-
-    # Interface JavaDoc
-    if enable_javadoc:
-        info = openapi_spec.get('info', {})
-        title = info.get('title', 'API')
-        description = info.get('description', '')
-
-        lines.append("/**")
-        lines.append(f" * Feign client for {title}.")
-        if description:
-            lines.append(f" * {description}")
-        lines.append(" */")
-
-    # FeignClient annotation (conditional)
-    if add_feign_annotation:
-        api_name = api_title.lower().replace(' ', '-')
-        lines.append(f'@FeignClient(name = "{api_name}", url = "${{feign.client.{api_name}.url}}")')
-
-    lines.append(f"public interface {client_name} {{")
-    lines.append("")
+    # Emit the method declarations first; the imports they need are only
+    # known once every parameter, request and response type has been resolved
+    body_lines = []
+    used_types = []
 
     # Generate methods grouped by tag
     for tag in sorted(operations_by_tag.keys()):
         operations = operations_by_tag[tag]
 
         # Add tag section comment
-        lines.append(f"    // ========================================")
-        lines.append(f"    // {tag}")
-        lines.append(f"    // ========================================")
-        lines.append("")
+        body_lines.append(f"    // ========================================")
+        body_lines.append(f"    // {tag}")
+        body_lines.append(f"    // ========================================")
+        body_lines.append("")
 
         for path, http_method, operation in operations:
-            operation_id = operation.get('operationId', f"{http_method}_{path.replace('/', '_')}")
-            method_name = to_java_method_name(operation_id)
+            method_name = method_name_for(operation.get('operationId', _NO_OPERATION_ID), http_method, path)
 
             summary = operation.get('summary', '')
             description = operation.get('description', '')
@@ -624,9 +531,10 @@ def generate_single_api_client(all_paths, openapi_spec, config):
                 required = param.get('required', False)
                 param_schema = param.get('schema', {})
                 param_type = get_java_type_from_schema(param_schema, schemas, components)
+                used_types.append(param_type)
 
                 # Skip parameter if it should be ignored
-                if param_name in ignore_params_list:
+                if param_name in ignore_params:
                     continue
 
                 # Skip optional parameters if configured to ignore them
@@ -636,32 +544,20 @@ def generate_single_api_client(all_paths, openapi_spec, config):
                 params.append(param)
 
                 # Create parameter annotation
-                if param_in == 'path':
-                    annotation = f'@PathVariable("{param_name}")'
-                elif param_in == 'query':
-                    if required:
-                        annotation = f'@RequestParam("{param_name}")'
-                    else:
-                        annotation = f'@RequestParam(value = "{param_name}", required = false)'
-                elif param_in == 'header':
-                    if required:
-                        annotation = f'@RequestHeader("{param_name}")'
-                    else:
-                        annotation = f'@RequestHeader(value = "{param_name}", required = false)'
-                else:
-                    annotation = f'@RequestParam("{param_name}")'
-
-                method_params.append(f"{annotation} {param_type} {param_java_name}")
+                annotation = param_annotation(param_in, bool(required), param_name)
+                method_params.append(' '.join((annotation, param_type, param_java_name)))
 
             # Check for request body
             request_body = operation.get('requestBody')
             request_body_type = get_request_body_type(request_body, schemas, components)
 
             if request_body_type:
+                used_types.append(request_body_type)
                 method_params.append(f"@RequestBody {request_body_type} body")
 
             # Get response type
             response_type = get_response_type(operation.get('responses', {}), schemas, components)
+            used_types.append(response_type)
             if use_response_entity:
                 return_type = f"ResponseEntity<{response_type}>" if response_type != 'void' else "ResponseEntity<Void>"
             else:
@@ -669,96 +565,178 @@ def generate_single_api_client(all_paths, openapi_spec, config):
 
             # Generate JavaDoc
             if enable_javadoc:
-                javadoc = generate_javadoc(summary, description, params, response_type, openapi_spec)
-                for line in javadoc.split('\n'):
-                    lines.append(f"    {line}")
+                emit_javadoc(body_lines, '    ', summary, description, params, response_type, openapi_spec)
 
             # Generate mapping annotation
-            mapping_method = http_method.lower().capitalize()
-            if mapping_method == 'Get':
-                mapping = 'GetMapping'
-            elif mapping_method == 'Post':
-                mapping = 'PostMapping'
-            elif mapping_method == 'Put':
-                mapping = 'PutMapping'
-            elif mapping_method == 'Delete':
-                mapping = 'DeleteMapping'
-            elif mapping_method == 'Patch':
-                mapping = 'PatchMapping'
-            else:
-                mapping = 'RequestMapping'
+            mapping = _MAPPING.get(http_method.lower(), 'RequestMapping')
 
-            lines.append(f'    @{mapping}("{path}")')
+            body_lines.append(f'    @{mapping}("{path}")')
 
             # Generate method signature
-            if format_one_param_per_line and len(method_params) > 0:
-                # Format with one parameter per line
-                lines.append(f"    {return_type} {method_name}(")
-                for i, param in enumerate(method_params):
-                    if i < len(method_params) - 1:
-                        lines.append(f"        {param},")
-                    else:
-                        lines.append(f"        {param}")
-                lines.append("    );")
-            else:
-                # Single line format
-                params_str = ', '.join(method_params)
-                lines.append(f"    {return_type} {method_name}({params_str});")
-            lines.append("")
-
-    lines.append("}")
-
-    return '\n'.join(lines)
+            emit_signature(body_lines, return_type, method_name, method_params)
+            body_lines.append("")
 
-def generate_feign_configuration(config):
-    """Generate FeignConfiguration class with common settings."""
-    base_package = config['feign']['base_package']
+    # Check if we need List, LocalDate, or LocalDateTime imports
+    has_lists, has_local_date, has_local_date_time = _type_import_flags(used_types)
 
+    # Start building the interface
     lines = []
-    lines.append(f"package {base_package}.config;")
-    lines.append("")
-    lines.append("import feign.Logger;")
-    lines.append("import feign.RequestInterceptor;")
-    lines.append("import feign.codec.ErrorDecoder;")
-    lines.append("import org.springframework.context.annotation.Bean;")
-    lines.append("import org.springframework.context.annotation.Configuration;")
-    lines.append("")
-    lines.append("/**")
-    lines.append(" * Common Feign client configuration.")
-    lines.append(" */")
-    lines.append("@Configuration")
-    lines.append("public class FeignConfiguration {")
+    lines.append(f"package {base_package};")
     lines.append("")
-    lines.append("    /**")
-    lines.append("     * Set Feign logging level.")
-    lines.append("     */")
-    lines.append("    @Bean")
-    lines.append("    public Logger.Level feignLoggerLevel() {")
-    lines.append("        return Logger.Level.FULL;")
-    lines.append("    }")
+
+    # Imports (FeignClient only if the annotation is enabled, ResponseEntity only if needed)
+    lines.extend(_client_import_lines(has_local_date, has_local_date_time, has_lists,
+                                      add_feign_annotation, use_response_entity))
+
     lines.append("")
-    lines.append("    /**")
-    lines.append("     * Custom error decoder for Feign clients.")
-    lines.append("     */")
-    lines.append("    @Bean")
-    lines.append("    public ErrorDecoder errorDecoder() {")
-    lines.append("        return new ErrorDecoder.Default();")
-    lines.append("    }")
+
+    # Interface JavaDoc
+    if enable_javadoc:
+        info = openapi_spec.get('info', {})
+        title = info.get('title', 'API')
+        description = info.get('description', '')
+
+        lines.append("/**")
+        lines.append(f" * Feign client for {title}.")
+        if description:
+            lines.append(f" * {description}")
+        lines.append(" */")
+
+    # FeignClient annotation (conditional)
+    if add_feign_annotation:
+        api_name = api_title.lower().replace(' ', '-')
+        lines.append(f'@FeignClient(name = "{api_name}", url = "${{feign.client.{api_name}.url}}")')
+
+    lines.append(f"public interface {client_name} {{")
     lines.append("")
+
+    # Write the header, the method declarations and the closing brace in one call
+    lines.extend(body_lines)
     lines.append("}")
+    out.write("\n".join(lines))
+
+# Below this many tags starting worker processes costs more than it saves
+_PARALLEL_MIN_TAGS = 8
+
+# Threads used to overlap file writes with generation below that threshold
+_WRITER_THREADS = 4
+
+# Per-worker (tags_dict, openapi_spec, config, output_dir), set once by _init_tag_worker
+_worker_state = None
+
+def _init_tag_worker(tags_dict, openapi_spec, config, output_dir):
+    """Receive the spec once per worker process rather than once per tag."""
+    global _worker_state
+    _reset_spec_caches()
+    _worker_state = (tags_dict, openapi_spec, config, output_dir)
+
+def _write_tag_client(tag, operations, openapi_spec, config, output_dir):
+    """Generate the Feign client for a tag straight into its Java file and return the path."""
+    client_name = to_java_class_name(tag) + config['feign']['interface_suffix']
+    file_path = os.path.join(output_dir, f"{client_name}.java")
+
+    with open_generated_file(file_path) as f:
+        generate_feign_client(tag, operations, openapi_spec, config, f)
+
+    return file_path
+
+def _write_tag_client_in_worker(tag):
+    """Write the Feign client for a single tag inside a worker process."""
+    tags_dict, openapi_spec, config, output_dir = _worker_state
+    return _write_tag_client(tag, tags_dict[tag], openapi_spec, config, output_dir)
+
+def write_tag_clients(tags_dict, openapi_spec, config, output_dir, max_workers=None):
+    """Write one Feign client per tag and yield (tag, file_path), in tag order.
+
+    Tags are independent of each other, so large specs fan the generation out
+    across up to max_workers worker processes (default: one per CPU); small
+    ones, or a budget of a single worker, are generated on a few threads.
+    """
+    tags = list(tags_dict)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if len(tags) < _PARALLEL_MIN_TAGS or max_workers <= 1:
+        # Generation holds the GIL but file creation and writes release it, so a
+        # few threads let one tag's file I/O overlap with the next tag's generation
+        with ThreadPoolExecutor(max_workers=_WRITER_THREADS) as executor:
+            yield from zip(tags, executor.map(
+                lambda tag: _write_tag_client(tag, tags_dict[tag], openapi_spec, config, output_dir), tags))
+        return
+
+    workers = min(len(tags), max_workers)
+    chunksize = max(1, len(tags) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_tag_worker,
+                             initargs=(tags_dict, openapi_spec, config, output_dir)) as executor:
+        yield from zip(tags, executor.map(_write_tag_client_in_worker, tags, chunksize=chunksize))
+
+# FeignConfiguration source, built once at import; only the package varies per run
+_FEIGN_CONFIGURATION_TEMPLATE = string.Template('\n'.join([
+    "package ${base_package}.config;",
+    "",
+    "import feign.Logger;",
+    "import feign.RequestInterceptor;",
+    "import feign.codec.ErrorDecoder;",
+    "import org.springframework.context.annotation.Bean;",
+    "import org.springframework.context.annotation.Configuration;",
+    "",
+    "/**",
+    " * Common Feign client configuration.",
+    " */",
+    "@Configuration",
+    "public class FeignConfiguration {",
+    "",
+    "    /**",
+    "     * Set Feign logging level.",
+    "     */",
+    "    @Bean",
+    "    public Logger.Level feignLoggerLevel() {",
+    "        return Logger.Level.FULL;",
+    "    }",
+    "",
+    "    /**",
+    "     * Custom error decoder for Feign clients.",
+    "     */",
+    "    @Bean",
+    "    public ErrorDecoder errorDecoder() {",
+    "        return new ErrorDecoder.Default();",
+    "    }",
+    "",
+    "}",
+]))
+
+def generate_feign_configuration(config):
+    """Generate FeignConfiguration class with common settings."""
+    return _FEIGN_CONFIGURATION_TEMPLATE.substitute(base_package=config['feign']['base_package'])
+
+def write_feign_configuration(output_dir, config):
+    """Write FeignConfiguration.java under output_dir/config and return its path."""
+    config_dir = os.path.join(output_dir, 'config')
+    os.makedirs(config_dir, exist_ok=True)
+
+    config_code = generate_feign_configuration(config)
+    config_file = os.path.join(config_dir, 'FeignConfiguration.java')
+
+    with open_generated_file(config_file) as f:
+        f.write(config_code)
+
+    return config_file
+
+def process_single_openapi_for_feign(openapi_file, output_dir, config, max_workers=None):
+    """Process a single OpenAPI definition for Feign client generation.
 
-    return '\n'.join(lines)
+    max_workers bounds the worker processes used for per-tag clients.
 
-def process_single_openapi_for_feign(openapi_file, output_dir, config):
-    """Process a single OpenAPI definition for Feign client generation."""
+    Returns:
+        Paths of the Java files generated for the definition
+    """
+    generated = []
 
     # Load OpenAPI spec
     if not os.path.exists(openapi_file):
         print(f"❌ {openapi_file} not found!")
-        return
-
-    with open(openapi_file, 'r', encoding='utf-8') as f:
-        openapi_spec = yaml.safe_load(f)
+        return generated
+    openapi_spec = load_openapi_spec(openapi_file)
+    _reset_spec_caches()
 
     base_package = config['feign']['base_package']
     generate_config_class = config['feign']['generate_config']
@@ -772,20 +750,20 @@ def process_single_openapi_for_feign(openapi_file, output_dir, config):
         print(f"  📝 Generating single Feign client for entire API")
 
         all_paths = [(path, path_item) for path, path_item in paths.items()]
-        client_code = generate_single_api_client(all_paths, openapi_spec, config)
 
         # Write to file
         api_title = openapi_spec.get('info', {}).get('title', 'Api')
         client_name = to_java_class_name(api_title.replace(' ', '')) + config['feign']['interface_suffix']
         file_path = os.path.join(output_dir, f"{client_name}.java")
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(client_code)
+        with open_generated_file(file_path) as f:
+            generate_single_api_client(all_paths, openapi_spec, config, f)
 
+        generated.append(file_path)
         print(f"     ✅ Created {file_path}")
     else:
         # Generate one client per tag (default behavior)
-        tags_dict = {}
+        tags_dict = collections.defaultdict(list)
 
         for path, path_item in paths.items():
             for method in ['get', 'post', 'put', 'delete', 'patch']:
@@ -794,41 +772,176 @@ def process_single_openapi_for_feign(openapi_file, output_dir, config):
                     operation_tags = operation.get('tags', ['Default'])
 
                     for tag in operation_tags:
-                        if tag not in tags_dict:
-                            tags_dict[tag] = []
-                        tags_dict[tag].append((path, {method: operation}))
+                        tags_dict[tag].append((path, method, operation))
 
         # Generate a Feign client for each tag
-        for tag, paths_by_tag in tags_dict.items():
+        for tag, file_path in write_tag_clients(tags_dict, openapi_spec, config, output_dir, max_workers):
+            generated.append(file_path)
             print(f"  📝 Generating Feign client for tag: {tag}")
-
-            client_code = generate_feign_client(tag, paths_by_tag, openapi_spec, config)
-
-            # Write to file
-            client_name = to_java_class_name(tag) + config['feign']['interface_suffix']
-            file_path = os.path.join(output_dir, f"{client_name}.java")
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(client_code)
-
             print(f"     ✅ Created {file_path}")
 
     # Generate configuration class if enabled
+    # Written only after the clients, so no thread is running when the tag pool forks
     if generate_config_class:
         print(f"  📝 Generating Feign configuration class")
-        config_dir = os.path.join(output_dir, 'config')
-        os.makedirs(config_dir, exist_ok=True)
+        config_file = write_feign_configuration(output_dir, config)
+        generated.append(config_file)
+        print(f"     ✅ Created {config_file}")
 
-        config_code = generate_feign_configuration(config)
-        config_file = os.path.join(config_dir, 'FeignConfiguration.java')
+    return generated
+
+# Separator line of the progress banners
+_SEP = '=' * 60
+
+# Upper bound on OpenAPI definitions processed at the same time
+_MAX_DEFINITION_WORKERS = 4
+
+# Per-definition record of the inputs its output directory was generated from
+_FINGERPRINT_FILE = '.oag_cache'
+
+# Generator sources folded into the fingerprint, so code changes also invalidate it
+_GENERATOR_SOURCES = (
+    os.path.abspath(__file__),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'name_utils.py'),
+    # Spec loading and parsing live in config.py
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.py'),
+)
+
+@contextlib.contextmanager
+def open_generated_file(file_path):
+    """Open a generated file for writing, keeping the existing file if the contents are identical."""
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yield f
+    except BaseException:
+        # The temp file does not exist if opening it was what failed
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    if _same_contents(tmp_path, file_path):
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, file_path)
+
+def _same_contents(new_path, old_path):
+    """Check whether old_path exists with exactly the same bytes as new_path."""
+    try:
+        if os.path.getsize(new_path) != os.path.getsize(old_path):
+            return False
+        with open(new_path, 'rb') as new_file, open(old_path, 'rb') as old_file:
+            return new_file.read() == old_file.read()
+    except OSError:
+        return False
+
+def _remove_stale_files(output_dir, generated):
+    """Delete files under output_dir that were not generated by this run, then empty folders."""
+    keep = {os.path.normpath(path) for path in generated}
+    keep.add(os.path.normpath(os.path.join(output_dir, _FINGERPRINT_FILE)))
+
+    for root, dirs, files in os.walk(output_dir, topdown=False):
+        for filename in files:
+            path = os.path.normpath(os.path.join(root, filename))
+            if path not in keep:
+                os.remove(path)
+        if root != output_dir and not os.listdir(root):
+            os.rmdir(root)
+
+def _spec_fingerprint(file_path, config):
+    """Hash an OpenAPI definition together with the Feign settings and generator code."""
+    digest = hashlib.sha256()
+    for path in (file_path,) + _GENERATOR_SOURCES:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    digest.update(json.dumps(config['feign'], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def _read_fingerprint(fingerprint_file):
+    """Return the fingerprint stored by a previous run, or None.
+
+    None is also returned when any file that run generated no longer exists,
+    so deleted output is always regenerated.
+    """
+    try:
+        with open(fingerprint_file, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        fingerprint = stored.get('hash')
+        files = stored['files']
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        return None
 
-        with open(config_file, 'w', encoding='utf-8') as f:
-            f.write(config_code)
+    # Generated files are recorded relative to the definition's output directory
+    output_dir = os.path.dirname(fingerprint_file)
+    if not all(os.path.isfile(os.path.join(output_dir, path)) for path in files):
+        return None
+    return fingerprint
+
+def process_definition(name, file_path, base_feign_folder, config, max_workers=None):
+    """Regenerate the Feign clients of one OpenAPI definition in its own subdirectory.
+
+    The subdirectory base_feign_folder/name must already exist (see create_output_dirs).
+    """
+    # Subdirectory for this definition
+    output_dir = os.path.join(base_feign_folder, name)
+    print(f"\n{_SEP}\n📋 Processing: {name} ({file_path})\n{_SEP}\n")
+
+    # Skip definitions whose spec, settings and generator are unchanged since the last run
+    fingerprint = _spec_fingerprint(file_path, config)
+    fingerprint_file = os.path.join(output_dir, _FINGERPRINT_FILE)
+    if _read_fingerprint(fingerprint_file) == fingerprint:
+        print(f"  ♻️  Unchanged since last run, keeping {output_dir}")
+        return
 
-        print(f"     ✅ Created {config_file}")
+    # Regenerate over the previous output: files whose contents did not change are
+    # left untouched and only files this run no longer produces are removed
+    generated = process_single_openapi_for_feign(file_path, output_dir, config, max_workers)
+    _remove_stale_files(output_dir, generated)
+
+    with open(fingerprint_file, 'w', encoding='utf-8') as f:
+        json.dump({'hash': fingerprint,
+                   'files': [os.path.relpath(path, output_dir) for path in generated]}, f)
+
+def create_output_dirs(base_feign_folder, definition_files):
+    """Create the output subdirectory of every definition in one concurrent pass."""
+    output_dirs = [os.path.join(base_feign_folder, name) for name, _ in definition_files]
+    with ThreadPoolExecutor(max_workers=min(len(output_dirs), 8)) as executor:
+        list(executor.map(functools.partial(os.makedirs, exist_ok=True), output_dirs))
+
+def _process_definition_captured(name, file_path, base_feign_folder, config, max_workers):
+    """Run process_definition in a worker process and return everything it printed.
+
+    If it fails, the output printed so far travels with the exception as its
+    captured_output attribute, so it is not lost.
+    """
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            process_definition(name, file_path, base_feign_folder, config, max_workers)
+    except Exception as e:
+        e.captured_output = output.getvalue()
+        raise
+    return output.getvalue()
+
+def parse_args(argv=None):
+    """Parse the command line options of the Feign generator."""
+    parser = argparse.ArgumentParser(description="Generate Feign clients from OpenAPI definitions.")
+    parser.add_argument('--only', nargs='+', action='extend', metavar='NAME',
+                        help="only process these definitions (file names without extension)")
+    parser.add_argument('--skip', nargs='+', action='extend', metavar='NAME',
+                        help="skip these definitions (file names without extension)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function to generate Feign clients.
+
+    Definitions are discovered by config.get_openapi_definition_files(): every
+    .yaml, .yml or .json file directly inside openapi_definitions_dir, found with
+    a single os.scandir pass and returned as sorted (name, path) pairs.
+    """
+    args = parse_args(argv)
 
-def main():
-    """Main function to generate Feign clients."""
     # Load configuration
     from config import get_config, get_openapi_definition_files
 
@@ -841,7 +954,11 @@ def main():
     print(f"🚀 Generating Feign clients...")
     print(f"   📋 Grouping strategy: {grouping_strategy}\n")
 
-    definition_files = get_openapi_definition_files()
+    # Restrict to the requested definitions for targeted re-runs
+    only = set(args.only or ())
+    skip = set(args.skip or ())
+    definition_files = [(name, file_path) for name, file_path in get_openapi_definition_files()
+                        if (not only or name in only) and name not in skip]
 
     if not definition_files:
         print("❌ No OpenAPI definition files found!")
@@ -849,26 +966,38 @@ def main():
 
     print(f"🚀 Processing {len(definition_files)} definition(s)...\n")
 
-    for name, file_path in definition_files:
-        # Create subdirectory for this definition
-        output_dir = os.path.join(base_feign_folder, name)
-        print(f"\n{'='*60}")
-        print(f"📋 Processing: {name} ({file_path})")
-        print(f"{'='*60}\n")
-
-        # Create output directory
-        if os.path.exists(output_dir):
-            import shutil
-            shutil.rmtree(output_dir)
-        os.makedirs(output_dir, exist_ok=True)
-
-        process_single_openapi_for_feign(file_path, output_dir, config)
-
-    print(f"\n{'='*60}")
-    print(f"✅ Feign client generation complete!")
-    print(f"   📁 Output directory: {base_feign_folder}")
-    print(f"   📦 Base package: {base_package}")
-    print(f"{'='*60}")
+    create_output_dirs(base_feign_folder, definition_files)
+
+    if len(definition_files) == 1:
+        name, file_path = definition_files[0]
+        process_definition(name, file_path, base_feign_folder, config)
+    else:
+        # Definitions are independent, so process them in parallel; each worker
+        # returns its captured output, printed whole and in definition order so
+        # logs never interleave and read the same on every run
+        cpus = os.cpu_count() or 1
+        workers = min(len(definition_files), cpus, _MAX_DEFINITION_WORKERS)
+        # Share the CPUs between the definition workers' own tag pools
+        tag_workers = max(1, cpus // workers)
+        first_error = None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_process_definition_captured, name, file_path, base_feign_folder, config, tag_workers)
+                       for name, file_path in definition_files]
+            for future in futures:
+                try:
+                    print(future.result(), end='')
+                except Exception as e:
+                    print(getattr(e, 'captured_output', ''), end='')
+                    if first_error is None:
+                        first_error = e
+        if first_error is not None:
+            raise first_error
+
+    print(f"\n{_SEP}\n"
+          f"✅ Feign client generation complete!\n"
+          f"   📁 Output directory: {base_feign_folder}\n"
+          f"   📦 Base package: {base_package}\n"
+          f"{_SEP}")
 
 if __name__ == '__main__':
     main()
@@ -2,12 +2,139 @@
 """
 Generate Java classes directly from OpenAPI schema for each endpoint.
 Each endpoint gets its own set of classes based solely on the OpenAPI definition.
+
+Generation is bound by interpreter work on dicts and strings rather than by
+memory, so the caches below matter most: schema analyses, dependency sets and
+rendered classes are kept per definition, and specs are parsed once with the
+libyaml loader.
 """
+import contextlib
+import functools
 import os
-import yaml
 import re
 import shutil
+import textwrap
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+from config import load_openapi_spec
+
+# Identifier patterns used by the name converters
+_NON_IDENT = re.compile(r'[^a-zA-Z0-9_]')
+_SPLIT = re.compile(r'[_\s-]+')
+
+# Maps every Latin-1 character that _NON_IDENT would replace to an underscore
+_IDENT_TRANS = str.maketrans({
+    chr(code): '_' for code in range(256)
+    if not (chr(code).isascii() and (chr(code).isalnum() or chr(code) == '_'))
+})
+
+def _is_upper_camel(name):
+    """Check for an ASCII letter-and-digit name starting with an uppercase letter, e.g. PetOwner."""
+    # String predicates avoid running the regex engine on the common, already valid names
+    return name.isascii() and name.isalnum() and name[0].isupper()
+
+def _is_lower_camel(name):
+    """Check for an ASCII letter-and-digit name starting with a lowercase letter, e.g. petOwner."""
+    return name.isascii() and name.isalnum() and name[0].islower()
+
+def _identifier_words(name):
+    """Split a name into words at underscores and any non-identifier characters.
+
+    Empty words are kept where separators repeat, callers skip them.
+    """
+    # One C-level translate instead of a regex substitution and a regex split
+    name = name.translate(_IDENT_TRANS)
+    if not name.isascii():
+        # Characters beyond the translation table
+        name = _NON_IDENT.sub('_', name)
+    return name.split('_')
+
+# Parent class named by the first 'extends' in a generated class source
+_EXTENDS_RE = re.compile(r'extends\s+(\w+)')
+
+# Parent class of a public (possibly abstract) class declaration
+_PARENT_CLASS_RE = re.compile(r'public\s+(?:abstract\s+)?class\s+\w+\s+extends\s+(\w+)')
+
+# Package declaration line of a generated class source
+_PACKAGE_RE = re.compile(r'^package\s+[\w.]+;', re.MULTILINE)
+
+# Import statement, split into package and class name
+_IMPORT_RE = re.compile(r'import\s+([\w.]+)\.([\w]+);')
+
+# Built-in Java types that never need an import for a generated class
+_BUILTIN_TYPES = frozenset({'String', 'Integer', 'Long', 'Double', 'Boolean', 'LocalDate', 'LocalDateTime', 'Object', 'List'})
+
+# Flags for creating or truncating a generated file (binary mode where the OS distinguishes it)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+# Number of threads writing generated files, and the batch size that warrants them
+_WRITER_THREADS = 8
+_PARALLEL_MIN_WRITES = 16
+
+def _ref_name(ref):
+    """Return the schema name at the end of a $ref such as #/components/schemas/Pet."""
+    return ref.rpartition('/')[2]
+
+# UTF-8 encoding of each class source written for the current definition, so a
+# source shared by several endpoints is only encoded once
+_encoded_sources = {}
+
+def _encode_source(text):
+    """Return the UTF-8 bytes of a generated class source, reusing earlier encodings."""
+    data = _encoded_sources.get(text)
+    if data is None:
+        data = _encoded_sources[text] = text.encode('utf-8')
+    return data
+
+def _write(path, data, dir_fd=None):
+    """Write bytes to path with unbuffered writes.
+
+    When dir_fd is an open descriptor of the file's directory, the file is
+    created relative to it so the kernel does not resolve the full path again.
+    """
+    if dir_fd is not None:
+        path = os.path.basename(path)
+    fd = os.open(path, _WRITE_FLAGS, 0o644, dir_fd=dir_fd)
+    try:
+        # os.write may write fewer bytes than given, keep going until all are written
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _flush_writes(pending, dir_fd=None):
+    """Write every pending {path: text} entry, once per path, after generation is done.
+
+    Larger batches are spread over a few threads; os.write releases the GIL, so
+    the writes overlap instead of waiting on each other.
+    """
+    writes = [(path, _encode_source(text)) for path, text in pending.items()]
+    if len(writes) < _PARALLEL_MIN_WRITES:
+        for path, data in writes:
+            _write(path, data, dir_fd)
+        return
+
+    with ThreadPoolExecutor(max_workers=_WRITER_THREADS) as executor:
+        # Consume the results so that a failed write raises here
+        for _ in executor.map(lambda write: _write(write[0], write[1], dir_fd), writes):
+            pass
 
+@contextlib.contextmanager
+def _directory_fd(path):
+    """Yield an open descriptor of directory path, or None where dir_fd is unsupported."""
+    if os.open not in os.supports_dir_fd:
+        yield None
+        return
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=4096)
 def to_java_package_name(folder_path):
     """Convert folder path to Java package name, preserving exact capitalization."""
     # Remove leading/trailing slashes
@@ -65,40 +192,134 @@ def get_package_for_file(file_path, base_package, output_dir, detect_package=Fal
     else:
         return base_package
 
+@functools.lru_cache(maxsize=4096)
 def to_java_class_name(name):
     """Convert schema name to Java class name."""
-    if re.match(r'^[A-Z][a-zA-Z0-9]*$', name):
+    if _is_upper_camel(name):
         return name
-    if re.match(r'^[a-z][a-zA-Z0-9]*$', name):
+    if _is_lower_camel(name):
         return name[0].upper() + name[1:]
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-    parts = re.split(r'[_\s-]+', name)
-    return ''.join(word.capitalize() for word in parts if word)
+    return ''.join(word.capitalize() for word in _identifier_words(name) if word)
 
+@functools.lru_cache(maxsize=4096)
 def to_java_field_name(name):
     """Convert to Java field name."""
-    if re.match(r'^[a-z][a-zA-Z0-9]*$', name):
-        return name
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-    parts = re.split(r'[_\s-]+', name)
-    if not parts:
+    if _is_lower_camel(name):
         return name
+    parts = _identifier_words(name)
     return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:] if word)
 
+def _wrap_javadoc(text, prefix):
+    """Wrap text into JavaDoc lines starting with prefix and at most 100 characters long."""
+    # Collapse whitespace runs first so wrapped lines match a plain split on words
+    text = ' '.join(text.split())
+    width = 100 - len(prefix)
+    lines = [prefix + line for line in textwrap.wrap(
+        text, width=width, break_long_words=False, break_on_hyphens=False)]
+    # A first word too long for the line has always been preceded by a bare prefix line
+    if len(text.partition(' ')[0]) >= width:
+        lines.insert(0, prefix)
+    return lines
+
+# Schema attributes that make a field worth documenting even without a description
+_FIELD_ATTRIBUTE_KEYS = frozenset({
+    # Common metadata
+    'title', 'description', 'default', 'example', 'examples', 'deprecated',
+    # Format and nullable
+    'format', 'nullable',
+    # Numeric constraints
+    'multipleOf', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
+    # String constraints
+    'minLength', 'maxLength', 'pattern',
+    # Array constraints
+    'minItems', 'maxItems', 'uniqueItems',
+    # Object constraints
+    'minProperties', 'maxProperties',
+    # Enum/const
+    'enum', 'const',
+    # Read/Write
+    'readOnly', 'writeOnly',
+    # Composition
+    'allOf', 'oneOf', 'anyOf', 'not',
+    # Discriminator
+    'discriminator',
+    # External docs
+    'externalDocs',
+    # XML
+    'xml',
+})
+
+def _javadoc_discriminator(discriminator):
+    """Render the @discriminator tag, preferring the discriminator's property name."""
+    if isinstance(discriminator, dict) and 'propertyName' in discriminator:
+        return f"     * @discriminator {discriminator['propertyName']}"
+    return f"     * @discriminator {discriminator}"
+
+def _javadoc_external_docs(ext_docs):
+    """Render the @see tag for externalDocs, or None when it has no URL."""
+    if isinstance(ext_docs, dict):
+        if 'url' in ext_docs:
+            desc = ext_docs.get('description', 'External documentation')
+            return f"     * @see {desc}: {ext_docs['url']}"
+        return None
+    return f"     * @see {ext_docs}"
+
+# Field JavaDoc tags in output order, after @title: (schema key, only when truthy, render).
+# render is None for "@key value", a fixed line, or a callable returning the line.
+_FIELD_JAVADOC_TAGS = (
+    ('deprecated', True, "     * @deprecated This field is deprecated"),
+    # Read-only / Write-only
+    ('readOnly', True, "     * @readOnly This field is read-only"),
+    ('writeOnly', True, "     * @writeOnly This field is write-only"),
+    ('nullable', True, "     * @nullable This field can be null"),
+    # Format (but not type - removed as requested)
+    ('format', False, None),
+    # Numeric constraints
+    ('multipleOf', False, None),
+    ('minimum', False, None),
+    ('maximum', False, None),
+    ('exclusiveMinimum', False, None),
+    ('exclusiveMaximum', False, None),
+    # String constraints
+    ('minLength', False, None),
+    ('maxLength', False, None),
+    ('pattern', False, None),
+    # Array constraints
+    ('minItems', False, None),
+    ('maxItems', False, None),
+    ('uniqueItems', True, "     * @uniqueItems Items must be unique"),
+    # Object constraints
+    ('minProperties', False, None),
+    ('maxProperties', False, None),
+    # Enum values
+    ('enum', True, lambda values: f"     * @enum {', '.join(str(v) for v in values)}"),
+    ('const', False, None),
+    ('default', False, None),
+    ('example', False, None),
+    # Limit to 3 examples
+    ('examples', True, lambda values: f"     * @examples {', '.join(str(v) for v in values[:3])}"),
+    # Discriminator (for polymorphism)
+    ('discriminator', False, _javadoc_discriminator),
+    # External documentation
+    ('externalDocs', False, _javadoc_external_docs),
+)
+
 def generate_field_javadoc(description, is_required, oneof_types=None, schema=None, schemas=None):
     """Generate JavaDoc for a field including all OpenAPI and JSON Schema attributes."""
     # Merge schema attributes from allOf references if present
     merged_schema = {}
     if schema:
-        merged_schema = schema.copy()
+        # Only read below, so the schema itself serves unless allOf attributes are merged in
+        merged_schema = schema
 
         # If schema has allOf, merge attributes from referenced schemas
         if 'allOf' in schema:
+            merged_schema = schema.copy()
             for item in schema['allOf']:
                 if isinstance(item, dict):
                     # If it's a reference, get the referenced schema
                     if '$ref' in item and schemas:
-                        ref_name = item['$ref'].split('/')[-1]
+                        ref_name = _ref_name(item['$ref'])
                         if ref_name in schemas:
                             ref_schema = schemas[ref_name]
                             # Merge attributes (but don't override existing ones)
@@ -114,33 +335,7 @@ def generate_field_javadoc(description, is_required, oneof_types=None, schema=No
     has_content = description or is_required or oneof_types
     if merged_schema:
         # Check if schema has any additional attributes
-        attribute_keys = [
-            # Common metadata
-            'title', 'description', 'default', 'example', 'examples', 'deprecated',
-            # Format and nullable
-            'format', 'nullable',
-            # Numeric constraints
-            'multipleOf', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
-            # String constraints
-            'minLength', 'maxLength', 'pattern',
-            # Array constraints
-            'minItems', 'maxItems', 'uniqueItems',
-            # Object constraints
-            'minProperties', 'maxProperties',
-            # Enum/const
-            'enum', 'const',
-            # Read/Write
-            'readOnly', 'writeOnly',
-            # Composition
-            'allOf', 'oneOf', 'anyOf', 'not',
-            # Discriminator
-            'discriminator',
-            # External docs
-            'externalDocs',
-            # XML
-            'xml'
-        ]
-        has_content = has_content or any(k in merged_schema for k in attribute_keys)
+        has_content = has_content or not _FIELD_ATTRIBUTE_KEYS.isdisjoint(merged_schema)
 
     if not has_content:
         return ""
@@ -151,16 +346,7 @@ def generate_field_javadoc(description, is_required, oneof_types=None, schema=No
     if description:
         desc = description.strip()
         if len(desc) > 80:
-            words = desc.split()
-            line = "     * "
-            for word in words:
-                if len(line) + len(word) + 1 > 100:
-                    javadoc_lines.append(line)
-                    line = "     * " + word
-                else:
-                    line += (" " if line != "     * " else "") + word
-            if line != "     * ":
-                javadoc_lines.append(line)
+            javadoc_lines.extend(_wrap_javadoc(desc, "     * "))
         else:
             javadoc_lines.append(f"     * {desc}")
 
@@ -182,181 +368,27 @@ def generate_field_javadoc(description, is_required, oneof_types=None, schema=No
                 added_blank_line = True
             javadoc_lines.append(f"     * @title {merged_schema['title']}")
 
-        # Deprecated
-        if merged_schema.get('deprecated'):
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append("     * @deprecated This field is deprecated")
-
-        # Read-only / Write-only
-        if merged_schema.get('readOnly'):
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append("     * @readOnly This field is read-only")
-
-        if merged_schema.get('writeOnly'):
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append("     * @writeOnly This field is write-only")
-
-        # Nullable
-        if merged_schema.get('nullable'):
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append("     * @nullable This field can be null")
-
-        # Format (but not type - removed as requested)
-        if 'format' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @format {merged_schema['format']}")
-
-        # Numeric constraints
-        if 'multipleOf' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @multipleOf {merged_schema['multipleOf']}")
-
-        if 'minimum' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @minimum {merged_schema['minimum']}")
-
-        if 'maximum' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @maximum {merged_schema['maximum']}")
-
-        if 'exclusiveMinimum' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @exclusiveMinimum {merged_schema['exclusiveMinimum']}")
-
-        if 'exclusiveMaximum' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @exclusiveMaximum {merged_schema['exclusiveMaximum']}")
-
-        # String constraints
-        if 'minLength' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @minLength {merged_schema['minLength']}")
-
-        if 'maxLength' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @maxLength {merged_schema['maxLength']}")
-
-        if 'pattern' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @pattern {merged_schema['pattern']}")
-
-        # Array constraints
-        if 'minItems' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @minItems {merged_schema['minItems']}")
-
-        if 'maxItems' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @maxItems {merged_schema['maxItems']}")
-
-        if merged_schema.get('uniqueItems'):
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append("     * @uniqueItems Items must be unique")
-
-        # Object constraints
-        if 'minProperties' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @minProperties {merged_schema['minProperties']}")
-
-        if 'maxProperties' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @maxProperties {merged_schema['maxProperties']}")
-
-        # Enum values
-        if 'enum' in merged_schema and merged_schema['enum']:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            enum_values = ', '.join(str(v) for v in merged_schema['enum'])
-            javadoc_lines.append(f"     * @enum {enum_values}")
-
-        # Const value
-        if 'const' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @const {merged_schema['const']}")
-
-        # Default value
-        if 'default' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @default {merged_schema['default']}")
-
-        # Example value(s)
-        if 'example' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            javadoc_lines.append(f"     * @example {merged_schema['example']}")
-
-        if 'examples' in merged_schema and merged_schema['examples']:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            examples_str = ', '.join(str(v) for v in merged_schema['examples'][:3])  # Limit to 3 examples
-            javadoc_lines.append(f"     * @examples {examples_str}")
+        for key, when_truthy, render in _FIELD_JAVADOC_TAGS:
+            if when_truthy:
+                if not merged_schema.get(key):
+                    continue
+            elif key not in merged_schema:
+                continue
 
-        # Discriminator (for polymorphism)
-        if 'discriminator' in merged_schema:
+            # Separate the tags from the description once, before the first tag
             if not added_blank_line:
                 javadoc_lines.append("     *")
                 added_blank_line = True
-            discriminator = merged_schema['discriminator']
-            if isinstance(discriminator, dict) and 'propertyName' in discriminator:
-                javadoc_lines.append(f"     * @discriminator {discriminator['propertyName']}")
-            else:
-                javadoc_lines.append(f"     * @discriminator {discriminator}")
 
-        # External documentation
-        if 'externalDocs' in merged_schema:
-            if not added_blank_line:
-                javadoc_lines.append("     *")
-                added_blank_line = True
-            ext_docs = merged_schema['externalDocs']
-            if isinstance(ext_docs, dict):
-                if 'url' in ext_docs:
-                    desc = ext_docs.get('description', 'External documentation')
-                    javadoc_lines.append(f"     * @see {desc}: {ext_docs['url']}")
+            value = merged_schema[key]
+            if render is None:
+                javadoc_lines.append(f"     * @{key} {value}")
+            elif isinstance(render, str):
+                javadoc_lines.append(render)
             else:
-                javadoc_lines.append(f"     * @see {ext_docs}")
+                line = render(value)
+                if line:
+                    javadoc_lines.append(line)
 
     # Required (always last)
     if is_required:
@@ -375,24 +407,30 @@ def generate_class_javadoc(description):
     # Split description into lines if too long
     desc = description.strip()
     if len(desc) > 80:
-        words = desc.split()
-        line = " * "
-        for word in words:
-            if len(line) + len(word) + 1 > 100:
-                javadoc_lines.append(line)
-                line = " * " + word
-            else:
-                line += (" " if line != " * " else "") + word
-        if line != " * ":
-            javadoc_lines.append(line)
+        javadoc_lines.extend(_wrap_javadoc(desc, " * "))
     else:
         javadoc_lines.append(f" * {desc}")
 
     javadoc_lines.append(" */")
     return "\n".join(javadoc_lines)
 
-def get_java_type_from_openapi(schema, schemas, visited=None, field_name=None):
-    """Get Java type from OpenAPI schema definition."""
+@functools.lru_cache(maxsize=4096)
+def _list_type(item_type):
+    """Return the Java List type of item_type, sharing one string per item type."""
+    return f"List<{item_type}>"
+
+def _class_type(class_name, refs):
+    """Return a generated class name as a Java type, recording it in refs when given."""
+    # Only names a capitalized Java identifier can be imported
+    if refs is not None and class_name[:1].isupper() and class_name[0].isascii() and class_name not in _BUILTIN_TYPES:
+        refs.add(class_name)
+    return class_name
+
+def get_java_type_from_openapi(schema, schemas, visited=None, field_name=None, refs=None):
+    """Get Java type from OpenAPI schema definition.
+
+    When refs is a set, the generated classes the type refers to are added to it.
+    """
     if visited is None:
         visited = set()
 
@@ -401,18 +439,18 @@ def get_java_type_from_openapi(schema, schemas, visited=None, field_name=None):
 
     # Handle $ref
     if '$ref' in schema:
-        ref_name = schema['$ref'].split('/')[-1]
+        ref_name = _ref_name(schema['$ref'])
         if ref_name in visited:
-            return to_java_class_name(ref_name)
+            return _class_type(to_java_class_name(ref_name), refs)
         visited.add(ref_name)
         if ref_name in schemas:
             ref_schema = schemas[ref_name]
             # If the referenced schema is just an array definition, expand it
             if ref_schema.get('type') == 'array' and 'properties' not in ref_schema and 'allOf' not in ref_schema:
                 items = ref_schema.get('items', {})
-                item_type = get_java_type_from_openapi(items, schemas, visited, field_name=None)
-                return f"List<{item_type}>"
-            return to_java_class_name(ref_name)
+                item_type = get_java_type_from_openapi(items, schemas, visited, field_name=None, refs=refs)
+                return _list_type(item_type)
+            return _class_type(to_java_class_name(ref_name), refs)
         return "Object"
 
     # Handle allOf - merge schemas
@@ -431,22 +469,22 @@ def get_java_type_from_openapi(schema, schemas, visited=None, field_name=None):
         # If it has both inline properties and a ref, it's an inline class with inheritance
         # Return the class name based on field_name
         if has_inline_props and has_ref and field_name:
-            return to_java_class_name(field_name)
+            return _class_type(to_java_class_name(field_name), refs)
 
         # If first item is $ref only, it's just inheritance reference
         if schema['allOf'] and '$ref' in schema['allOf'][0]:
-            return get_java_type_from_openapi(schema['allOf'][0], schemas, visited, field_name)
+            return get_java_type_from_openapi(schema['allOf'][0], schemas, visited, field_name, refs=refs)
 
         # Otherwise find any $ref
         for item in schema['allOf']:
             if '$ref' in item:
-                return get_java_type_from_openapi(item, schemas, visited, field_name)
+                return get_java_type_from_openapi(item, schemas, visited, field_name, refs=refs)
         return "Object"
 
     # Handle oneOf - use first type
     if 'oneOf' in schema:
         if schema['oneOf'] and '$ref' in schema['oneOf'][0]:
-            return get_java_type_from_openapi(schema['oneOf'][0], schemas, visited, field_name=None)
+            return get_java_type_from_openapi(schema['oneOf'][0], schemas, visited, field_name=None, refs=refs)
         return "Object"
 
     # Handle type
@@ -467,37 +505,18 @@ def get_java_type_from_openapi(schema, schemas, visited=None, field_name=None):
         return "Boolean"
     elif schema_type == 'array':
         items = schema.get('items', {})
-        item_type = get_java_type_from_openapi(items, schemas, visited, field_name=None)
-        return f"List<{item_type}>"
+        item_type = get_java_type_from_openapi(items, schemas, visited, field_name=None, refs=refs)
+        return _list_type(item_type)
     elif schema_type == 'object':
         # If it has properties, it's an inline type - generate class name from field name
         if 'properties' in schema and field_name:
-            return to_java_class_name(field_name)
+            return _class_type(to_java_class_name(field_name), refs)
         return "Object"
 
     return "Object"
 
-def get_all_schema_dependencies(schema_name, schemas, visited=None):
-    """Recursively get all schema dependencies for a schema."""
-    if visited is None:
-        visited = set()
-
-    if schema_name in visited or schema_name not in schemas:
-        return visited
-
-    schema = schemas[schema_name]
-
-    # Skip schemas that are just array definitions (no properties, just type: array)
-    # These should be used as List<ItemType>, not as separate classes
-    if schema.get('type') == 'array' and 'properties' not in schema and 'allOf' not in schema:
-        # Don't add this schema, but add the items type
-        if 'items' in schema and '$ref' in schema['items']:
-            ref_name = schema['items']['$ref'].split('/')[-1]
-            get_all_schema_dependencies(ref_name, schemas, visited)
-        return visited
-
-    visited.add(schema_name)
-
+def _iter_schema_refs(schema):
+    """Yield the names of the schemas a class schema refers to through $ref."""
     # Get properties
     properties = {}
     if 'properties' in schema:
@@ -508,120 +527,185 @@ def get_all_schema_dependencies(schema_name, schemas, visited=None):
         for item in schema['allOf']:
             if isinstance(item, dict):
                 if '$ref' in item:
-                    ref_name = item['$ref'].split('/')[-1]
-                    get_all_schema_dependencies(ref_name, schemas, visited)
+                    yield _ref_name(item['$ref'])
                 if 'properties' in item:
                     properties.update(item['properties'])
 
     # Process each property
-    for prop_name, prop_schema in properties.items():
+    for prop_schema in properties.values():
         if '$ref' in prop_schema:
-            ref_name = prop_schema['$ref'].split('/')[-1]
-            get_all_schema_dependencies(ref_name, schemas, visited)
+            yield _ref_name(prop_schema['$ref'])
 
         if 'allOf' in prop_schema:
             for item in prop_schema['allOf']:
                 if '$ref' in item:
-                    ref_name = item['$ref'].split('/')[-1]
-                    get_all_schema_dependencies(ref_name, schemas, visited)
+                    yield _ref_name(item['$ref'])
                 # Also check for inline properties within allOf
                 if 'properties' in item:
-                    for sub_prop_name, sub_prop_schema in item['properties'].items():
+                    for sub_prop_schema in item['properties'].values():
                         if '$ref' in sub_prop_schema:
-                            ref_name = sub_prop_schema['$ref'].split('/')[-1]
-                            get_all_schema_dependencies(ref_name, schemas, visited)
+                            yield _ref_name(sub_prop_schema['$ref'])
 
         if 'oneOf' in prop_schema:
             for item in prop_schema['oneOf']:
                 if '$ref' in item:
-                    ref_name = item['$ref'].split('/')[-1]
-                    get_all_schema_dependencies(ref_name, schemas, visited)
+                    yield _ref_name(item['$ref'])
 
         if prop_schema.get('type') == 'array' and 'items' in prop_schema:
             items = prop_schema['items']
             if '$ref' in items:
-                ref_name = items['$ref'].split('/')[-1]
-                get_all_schema_dependencies(ref_name, schemas, visited)
+                yield _ref_name(items['$ref'])
 
         # Handle inline object types with properties
         if prop_schema.get('type') == 'object' and 'properties' in prop_schema:
             # Follow references within inline object
-            for inline_prop_name, inline_prop_schema in prop_schema['properties'].items():
+            for inline_prop_schema in prop_schema['properties'].values():
                 if '$ref' in inline_prop_schema:
-                    ref_name = inline_prop_schema['$ref'].split('/')[-1]
-                    get_all_schema_dependencies(ref_name, schemas, visited)
+                    yield _ref_name(inline_prop_schema['$ref'])
                 if 'allOf' in inline_prop_schema:
                     for item in inline_prop_schema['allOf']:
                         if '$ref' in item:
-                            ref_name = item['$ref'].split('/')[-1]
-                            get_all_schema_dependencies(ref_name, schemas, visited)
+                            yield _ref_name(item['$ref'])
+
+def get_all_schema_dependencies(schema_name, schemas, visited=None):
+    """Get all schema dependencies for a schema, following $refs with a worklist.
+
+    Top-level calls (without visited) are cached per definition; the caller
+    gets its own copy of the cached set.
+    """
+    if visited is None:
+        cache = _render_cache_for(schemas)
+        deps = cache.get(('deps', schema_name))
+        if deps is None:
+            deps = frozenset(get_all_schema_dependencies(schema_name, schemas, set()))
+            cache[('deps', schema_name)] = deps
+        return set(deps)
+
+    # Explicit stack instead of recursion, so deep schema graphs cannot hit the recursion limit
+    pending = [schema_name]
+    # Array definitions are never added to visited, so remember them here to stop on cycles
+    seen_arrays = set()
+    while pending:
+        name = pending.pop()
+        if name in visited or name not in schemas:
+            continue
+
+        schema = schemas[name]
+
+        # Skip schemas that are just array definitions (no properties, just type: array)
+        # These should be used as List<ItemType>, not as separate classes
+        if schema.get('type') == 'array' and 'properties' not in schema and 'allOf' not in schema:
+            # Don't add this schema, but add the items type
+            if name in seen_arrays:
+                continue
+            seen_arrays.add(name)
+            if 'items' in schema and '$ref' in schema['items']:
+                pending.append(_ref_name(schema['items']['$ref']))
+            continue
+
+        visited.add(name)
+        pending.extend(_iter_schema_refs(schema))
 
     return visited
 
-def get_base_class(schema_name, schemas):
-    """Get base class if schema uses allOf with $ref as first element."""
-    if schema_name not in schemas:
-        return None
+class SchemaInfo(NamedTuple):
+    """What class generation needs to know about one schema, gathered in a single walk."""
+    properties: dict
+    all_properties: dict
+    base_class: Optional[str]
+    oneof_field: Tuple[Optional[str], Optional[list]]
+    required: frozenset
 
-    schema = schemas[schema_name]
-    if 'allOf' in schema and schema['allOf']:
-        first = schema['allOf'][0]
-        if '$ref' in first:
-            return first['$ref'].split('/')[-1]
+# Analysis of a schema name that is not in the definition
+_MISSING_SCHEMA_INFO = SchemaInfo({}, {}, None, (None, None), frozenset())
 
-    return None
+def analyze_schema(schema_name, schemas):
+    """Return the SchemaInfo of a schema, walking its properties and allOf items once.
 
-def get_schema_properties(schema_name, schemas, include_inherited=False):
-    """Get all properties for a schema."""
+    properties excludes what is inherited through allOf $refs, all_properties
+    includes it. Results are cached per definition and shared between callers,
+    so they must not be modified.
+    """
     if schema_name not in schemas:
-        return {}
+        return _MISSING_SCHEMA_INFO
+
+    cache = _render_cache_for(schemas)
+    info = cache.get(('info', schema_name))
+    if info is not None:
+        return info
 
     schema = schemas[schema_name]
     properties = {}
+    all_properties = {}
+    base_class = None
+    required = set(schema.get('required', ()))
 
     # Direct properties
     if 'properties' in schema:
         properties.update(schema['properties'])
+        all_properties.update(schema['properties'])
 
-    # Properties from allOf
+    # Properties, parents and required fields from allOf
     if 'allOf' in schema:
-        for item in schema['allOf']:
+        all_of = schema['allOf']
+        # The first $ref in allOf is the base class
+        if all_of and '$ref' in all_of[0]:
+            base_class = _ref_name(all_of[0]['$ref'])
+        for item in all_of:
             if isinstance(item, dict):
-                # Skip $ref if we don't want inherited properties
-                if '$ref' in item and not include_inherited:
-                    continue
-                if '$ref' in item and include_inherited:
-                    ref_name = item['$ref'].split('/')[-1]
-                    inherited = get_schema_properties(ref_name, schemas, True)
-                    properties.update(inherited)
-                if 'properties' in item:
+                required.update(item.get('required', ()))
+                if '$ref' in item:
+                    # Inherited properties, and the item's own properties only count as inherited too
+                    inherited = analyze_schema(_ref_name(item['$ref']), schemas).all_properties
+                    all_properties.update(inherited)
+                    if 'properties' in item:
+                        all_properties.update(item['properties'])
+                elif 'properties' in item:
                     properties.update(item['properties'])
+                    all_properties.update(item['properties'])
+
+    # First oneOf field, declared directly or in an inline allOf item
+    oneof_field = (None, None)
+    for prop_name, prop_schema in properties.items():
+        if 'oneOf' in prop_schema:
+            oneof_field = (prop_name, prop_schema['oneOf'])
+            break
+
+    info = SchemaInfo(properties, all_properties, base_class, oneof_field, frozenset(required))
+    cache[('info', schema_name)] = info
+    return info
+
+def get_schema_properties(schema_name, schemas, include_inherited=False):
+    """Get all properties for a schema.
 
-    return properties
+    The result is shared between callers and must not be modified.
+    """
+    info = analyze_schema(schema_name, schemas)
+    return info.all_properties if include_inherited else info.properties
 
 def has_oneof_field(schema_name, schemas):
     """Check if schema has oneOf fields."""
-    props = get_schema_properties(schema_name, schemas, False)
-    for prop_name, prop_schema in props.items():
-        if 'oneOf' in prop_schema:
-            return prop_name, prop_schema['oneOf']
-    return None, None
+    return analyze_schema(schema_name, schemas).oneof_field
 
 def find_oneof_base_class(schema_name, schemas):
     """Find if this schema is part of a oneOf and return the base class name."""
-    # Search through all schemas to find oneOf references
-    for parent_schema_name, parent_schema in schemas.items():
-        props = get_schema_properties(parent_schema_name, schemas, False)
-        for prop_name, prop_schema in props.items():
-            if 'oneOf' in prop_schema:
-                # Check if our schema is in this oneOf
-                for option in prop_schema['oneOf']:
-                    if '$ref' in option:
-                        ref_name = option['$ref'].split('/')[-1]
-                        if ref_name == schema_name:
-                            # This schema is part of a oneOf, return the base class name
-                            return to_java_class_name(prop_name)
-    return None
+    cache = _render_cache_for(schemas)
+    oneof_base_by_member = cache.get('oneof_members')
+    if oneof_base_by_member is None:
+        # Map every schema referenced from a oneOf field to that field's base class,
+        # keeping the first field that references it
+        oneof_base_by_member = {}
+        for parent_schema_name in schemas:
+            props = get_schema_properties(parent_schema_name, schemas, False)
+            for prop_name, prop_schema in props.items():
+                if 'oneOf' in prop_schema:
+                    for option in prop_schema['oneOf']:
+                        if '$ref' in option:
+                            ref_name = _ref_name(option['$ref'])
+                            if ref_name not in oneof_base_by_member:
+                                oneof_base_by_member[ref_name] = to_java_class_name(prop_name)
+        cache['oneof_members'] = oneof_base_by_member
+    return oneof_base_by_member.get(schema_name)
 
 def generate_java_class_from_schema(schema_name, schemas, package, processed=None, enable_javadoc=True, enable_imports=False):
     """Generate Java class from OpenAPI schema."""
@@ -642,8 +726,10 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
 
     class_name = to_java_class_name(schema_name)
 
+    info = analyze_schema(schema_name, schemas)
+
     # Check for base class from allOf
-    base_class = get_base_class(schema_name, schemas)
+    base_class = info.base_class
     base_class_name = to_java_class_name(base_class) if base_class else None
 
     # If no allOf base class, check if this is part of a oneOf
@@ -653,15 +739,15 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
             base_class_name = oneof_base
 
     # Get properties (exclude inherited if has base class)
-    all_props = get_schema_properties(schema_name, schemas, True)
+    all_props = info.all_properties
     if base_class_name:
-        base_props = get_schema_properties(base_class, schemas, True)
+        base_props = analyze_schema(base_class, schemas).all_properties
         own_props = {k: v for k, v in all_props.items() if k not in base_props}
     else:
         own_props = all_props
 
     # Check for oneOf fields
-    oneof_field_name, oneof_types = has_oneof_field(schema_name, schemas)
+    oneof_field_name, oneof_types = info.oneof_field
     generic_param = None
     if oneof_field_name and oneof_types:
         # Create generic parameter
@@ -675,13 +761,8 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
     fields = []
     referenced_classes = set()
 
-    # Get required fields list from schema
-    required_fields = schema.get('required', [])
-    # Also check in allOf items
-    if 'allOf' in schema:
-        for item in schema['allOf']:
-            if isinstance(item, dict) and 'required' in item:
-                required_fields.extend(item['required'])
+    # Required fields from the schema and its allOf items
+    required_fields = info.required
 
     for prop_name, prop_schema in own_props.items():
         java_field = to_java_field_name(prop_name)
@@ -695,7 +776,7 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
         # Check if this is the oneOf field
         if oneof_field_name and prop_name == oneof_field_name:
             java_type = f"T{to_java_class_name(prop_name)}"
-            types_list = [to_java_class_name(t.get('$ref', '').split('/')[-1]) for t in oneof_types if '$ref' in t]
+            types_list = [to_java_class_name(_ref_name(t['$ref'])) for t in oneof_types if '$ref' in t]
 
             # Generate JavaDoc for oneOf field if enabled
             if enable_javadoc:
@@ -706,14 +787,8 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
             # Add base class to referenced classes
             referenced_classes.add(to_java_class_name(prop_name))
         else:
-            java_type = get_java_type_from_openapi(prop_schema, schemas, field_name=prop_name)
-
-            # Extract class names from type
-            # Handle List<ClassName>, ClassName, etc.
-            type_classes = re.findall(r'\b([A-Z][a-zA-Z0-9]*)\b', java_type)
-            for type_class in type_classes:
-                if type_class not in ['String', 'Integer', 'Long', 'Double', 'Boolean', 'LocalDate', 'LocalDateTime', 'Object', 'List']:
-                    referenced_classes.add(type_class)
+            # Collect the classes the type refers to, e.g. Pet for List<Pet>
+            java_type = get_java_type_from_openapi(prop_schema, schemas, field_name=prop_name, refs=referenced_classes)
 
             # Generate JavaDoc for regular field if enabled
             if enable_javadoc:
@@ -738,8 +813,8 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
 
     # Add imports for referenced classes if enabled
     if enable_imports:
-        for ref_class in sorted(referenced_classes):
-            imports.add(f"import {package}.{ref_class};")
+        # No need to sort here, the combined imports are sorted when the class is built
+        imports.update(f"import {package}.{ref_class};" for ref_class in referenced_classes)
 
     # Determine which Lombok annotations are needed
     lombok_imports = set()
@@ -757,9 +832,10 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
     # Combine all imports
     all_imports = imports.union(lombok_imports)
 
-    # Build class
-    java_code = f"package {package};\n\n"
-    java_code += "\n".join(sorted(all_imports)) + "\n\n"
+    # Build class as a list of lines, joined once at the end
+    java_lines = [f"package {package};", ""]
+    java_lines.extend(sorted(all_imports))
+    java_lines.append("")
 
     # Add class JavaDoc if enabled
     if enable_javadoc:
@@ -768,44 +844,120 @@ def generate_java_class_from_schema(schema_name, schemas, package, processed=Non
             class_description = f"{class_name} class."
         class_javadoc = generate_class_javadoc(class_description)
         if class_javadoc:
-            java_code += class_javadoc + "\n"
+            java_lines.append(class_javadoc)
 
-    java_code += "@Data\n"
+    java_lines.append("@Data")
 
     if base_class_name:
-        java_code += "@EqualsAndHashCode(callSuper = true)\n"
+        java_lines.append("@EqualsAndHashCode(callSuper = true)")
 
-    java_code += "@NoArgsConstructor\n"
+    java_lines.append("@NoArgsConstructor")
     # Only add @AllArgsConstructor if the class has fields
     if fields:
-        java_code += "@AllArgsConstructor\n"
+        java_lines.append("@AllArgsConstructor")
 
     # Class declaration
     if base_class_name:
         if generic_param:
-            java_code += f"public class {class_name}<{generic_param}> extends {base_class_name} {{\n\n"
+            java_lines.append(f"public class {class_name}<{generic_param}> extends {base_class_name} {{")
         else:
-            java_code += f"public class {class_name} extends {base_class_name} {{\n\n"
+            java_lines.append(f"public class {class_name} extends {base_class_name} {{")
     else:
         # Only add @Builder if the class has fields
         if fields:
-            java_code += "@Builder\n"
+            java_lines.append("@Builder")
         if generic_param:
-            java_code += f"public class {class_name}<{generic_param}> {{\n\n"
+            java_lines.append(f"public class {class_name}<{generic_param}> {{")
         else:
-            java_code += f"public class {class_name} {{\n\n"
+            java_lines.append(f"public class {class_name} {{")
+    java_lines.append("")
 
     if fields:
-        java_code += "\n".join(fields)
+        java_lines.extend(fields)
     else:
         if base_class_name:
-            java_code += f"    // All fields inherited from {base_class_name}"
+            java_lines.append(f"    // All fields inherited from {base_class_name}")
         else:
-            java_code += "    // No fields"
+            java_lines.append("    // No fields")
 
-    java_code += "\n}\n"
+    java_lines.append("}")
+    java_lines.append("")
 
-    return java_code
+    return "\n".join(java_lines)
+
+# Rendered class sources of the current definition, keyed by kind, schema name and options,
+# plus the schema lookup tables under the "lookup" key and the per-schema analyses,
+# dependencies and oneOf memberships used while rendering
+_render_cache = {}
+_render_cache_schemas = None
+
+def _render_cache_for(schemas):
+    """Return the render cache, emptying it and the encoded sources when a different schemas dict is rendered."""
+    global _render_cache_schemas
+    if schemas is not _render_cache_schemas:
+        _render_cache.clear()
+        _encoded_sources.clear()
+        _render_cache_schemas = schemas
+    return _render_cache
+
+def schema_lookup_tables(schemas):
+    """Return (oneof_base_by_schema, class_name_by_schema) for schemas, built once per definition.
+
+    oneof_base_by_schema only holds schemas with a oneOf field, mapped to the
+    name of the abstract base class generated for that field.
+    """
+    cache = _render_cache_for(schemas)
+    tables = cache.get('lookup')
+    if tables is None:
+        oneof_base_by_schema = {}
+        for schema_name in schemas:
+            oneof_field, oneof_types = has_oneof_field(schema_name, schemas)
+            if oneof_field and oneof_types:
+                oneof_base_by_schema[schema_name] = to_java_class_name(oneof_field)
+        class_name_by_schema = {schema_name: to_java_class_name(schema_name) for schema_name in schemas}
+        cache['lookup'] = tables = (oneof_base_by_schema, class_name_by_schema)
+    return tables
+
+# Minimum number of schemas before class rendering is spread across processes
+_PARALLEL_MIN_SCHEMAS = 32
+
+# Schemas and render options of the definition being rendered, set once per worker process
+_worker_render_args = None
+
+def _init_render_worker(schemas, package, enable_javadoc, enable_imports):
+    """Store the definition shared by every render task in this worker process."""
+    global _worker_render_args
+    _worker_render_args = (schemas, package, enable_javadoc, enable_imports)
+
+def _render_schema_in_worker(schema_name):
+    """Render one schema class inside a worker process."""
+    schemas, package, enable_javadoc, enable_imports = _worker_render_args
+    return generate_java_class_from_schema(schema_name, schemas, package, enable_javadoc=enable_javadoc, enable_imports=enable_imports)
+
+def render_schema_classes(schema_names, schemas, package, enable_javadoc=True, enable_imports=False):
+    """Render the Java class of each schema, in the order of schema_names.
+
+    Each schema is rendered once per definition and reused for every endpoint
+    that needs it. Large batches are rendered in a process pool; writing the
+    results is left to the caller so filesystem changes stay in this process.
+    """
+    cache = _render_cache_for(schemas)
+    options = (package, enable_javadoc, enable_imports)
+    missing = [schema_name for schema_name in dict.fromkeys(schema_names) if ('class', schema_name, options) not in cache]
+
+    if len(missing) < _PARALLEL_MIN_SCHEMAS:
+        for schema_name in missing:
+            cache[('class', schema_name, options)] = generate_java_class_from_schema(
+                schema_name, schemas, package, enable_javadoc=enable_javadoc, enable_imports=enable_imports)
+    else:
+        # Forking while a deletion thread runs could deadlock the workers
+        _finish_discards()
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_render_worker,
+                                 initargs=(schemas, package, enable_javadoc, enable_imports)) as executor:
+            for schema_name, java_code in zip(missing, executor.map(_render_schema_in_worker, missing, chunksize=16)):
+                cache[('class', schema_name, options)] = java_code
+
+    return [cache[('class', schema_name, options)] for schema_name in schema_names]
 
 def generate_base_class_for_oneof(base_name, package, enable_javadoc=True):
     """Generate abstract base class for oneOf."""
@@ -870,14 +1022,13 @@ def organize_classes_in_folder(folder_dir, main_class_name, all_generated_classe
             content = f.read()
 
         # Extract extends
-        extends_match = re.search(r'extends\s+(\w+)', content)
+        extends_match = _EXTENDS_RE.search(content)
         extends = extends_match.group(1) if extends_match else None
 
         class_info[class_name] = {
             'filename': filename,
             'extends': extends,
-            'children': [],
-            'content': content
+            'children': []
         }
 
     # Build children relationships
@@ -891,6 +1042,19 @@ def organize_classes_in_folder(folder_dir, main_class_name, all_generated_classe
             return name
         return name[0].lower() + name[1:]
 
+    # Current path of each class file placed so far
+    placed = {}
+
+    def place(class_name, dest_dir):
+        """Move a class file out of the temp folder, or copy it if it was already placed elsewhere."""
+        filename = class_info[class_name]['filename']
+        dest = os.path.join(dest_dir, filename)
+        if class_name in placed:
+            shutil.copyfile(placed[class_name], dest)
+        else:
+            shutil.move(os.path.join(temp_dir, filename), dest)
+            placed[class_name] = dest
+
     # Organize files: group by inheritance
     processed = set()
 
@@ -905,17 +1069,12 @@ def organize_classes_in_folder(folder_dir, main_class_name, all_generated_classe
             os.makedirs(family_dir, exist_ok=True)
 
             # Move base class
-            dest = os.path.join(family_dir, info['filename'])
-            with open(dest, 'w', encoding='utf-8') as f:
-                f.write(info['content'])
+            place(class_name, family_dir)
             processed.add(class_name)
 
             # Move children
             for child_name in info['children']:
-                child_info = class_info[child_name]
-                dest = os.path.join(family_dir, child_info['filename'])
-                with open(dest, 'w', encoding='utf-8') as f:
-                    f.write(child_info['content'])
+                place(child_name, family_dir)
                 processed.add(child_name)
 
     # Move remaining classes (no inheritance) to related root
@@ -923,23 +1082,26 @@ def organize_classes_in_folder(folder_dir, main_class_name, all_generated_classe
         if class_name in processed:
             continue
 
-        dest = os.path.join(related_dir, info['filename'])
-        with open(dest, 'w', encoding='utf-8') as f:
-            f.write(info['content'])
+        place(class_name, related_dir)
         processed.add(class_name)
 
     # Clean up temp directory
     shutil.rmtree(temp_dir)
 
-def generate_inline_classes(schema_name, schemas, package, folder_dir):
+def render_inline_classes(schema_name, schemas, package):
     """
-    Generate Java classes for inline object types found in a schema.
-    Returns a set of generated class names.
+    Render the Java classes for inline object types found in a schema.
+    Returns a tuple of (class_name, java_code) pairs, cached per schema and package.
     """
+    cache = _render_cache_for(schemas)
+    key = ('inline', schema_name, package)
+    if key in cache:
+        return cache[key]
+
     if schema_name not in schemas:
-        return set()
+        return ()
 
-    generated = set()
+    rendered = []
     schema = schemas[schema_name]
 
     # Get all properties
@@ -975,10 +1137,7 @@ def generate_inline_classes(schema_name, schemas, package, folder_dir):
             )
 
             if java_code:
-                filepath = os.path.join(folder_dir, f"{inline_class_name}.java")
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(java_code)
-                generated.add(inline_class_name)
+                rendered.append((inline_class_name, java_code))
 
         # Case 2: allOf with inline properties + $ref (inheritance with extra properties)
         elif 'allOf' in prop_schema:
@@ -993,7 +1152,7 @@ def generate_inline_classes(schema_name, schemas, package, folder_dir):
                         has_inline_props = True
                         inline_props.update(item.get('properties', {}))
                     if '$ref' in item:
-                        base_class_ref = item['$ref'].split('/')[-1]
+                        base_class_ref = _ref_name(item['$ref'])
 
             # If it has both inline properties and a base class, generate an inline class with inheritance
             if has_inline_props and base_class_ref:
@@ -1015,12 +1174,10 @@ def generate_inline_classes(schema_name, schemas, package, folder_dir):
                 )
 
                 if java_code:
-                    filepath = os.path.join(folder_dir, f"{inline_class_name}.java")
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(java_code)
-                    generated.add(inline_class_name)
+                    rendered.append((inline_class_name, java_code))
 
-    return generated
+    cache[key] = rendered = tuple(rendered)
+    return rendered
 
 def generate_java_class_from_inline_schema(class_name, inline_schema, schemas, package, enable_javadoc=True, enable_imports=False):
     """Generate Java class from an inline schema definition."""
@@ -1044,7 +1201,8 @@ def generate_java_class_from_inline_schema(class_name, inline_schema, schemas, p
 
     for prop_name, prop_schema in properties.items():
         java_field = to_java_field_name(prop_name)
-        java_type = get_java_type_from_openapi(prop_schema, schemas, field_name=prop_name)
+        # Collect the classes the type refers to, e.g. Pet for List<Pet>
+        java_type = get_java_type_from_openapi(prop_schema, schemas, field_name=prop_name, refs=referenced_classes)
 
         # Check if this field is required
         is_required = prop_name in required_fields
@@ -1052,12 +1210,6 @@ def generate_java_class_from_inline_schema(class_name, inline_schema, schemas, p
         # Get field description
         field_description = prop_schema.get('description', '')
 
-        # Extract class names from type
-        type_classes = re.findall(r'\b([A-Z][a-zA-Z0-9]*)\b', java_type)
-        for type_class in type_classes:
-            if type_class not in ['String', 'Integer', 'Long', 'Double', 'Boolean', 'LocalDate', 'LocalDateTime', 'Object', 'List']:
-                referenced_classes.add(type_class)
-
         # Add necessary imports
         if "List" in java_type:
             imports.add("import java.util.List;")
@@ -1077,8 +1229,8 @@ def generate_java_class_from_inline_schema(class_name, inline_schema, schemas, p
 
     # Add imports for referenced classes if enabled
     if enable_imports:
-        for ref_class in sorted(referenced_classes):
-            imports.add(f"import {package}.{ref_class};")
+        # No need to sort here, the combined imports are sorted when the class is built
+        imports.update(f"import {package}.{ref_class};" for ref_class in referenced_classes)
 
     # Determine which Lombok annotations are needed
     lombok_imports = set()
@@ -1154,6 +1306,7 @@ def process_endpoint(endpoint_name, request_schema, response_schemas, schemas, o
     endpoint_dir = os.path.join(output_dir, endpoint_name)
     all_schemas_for_endpoint = set()
     endpoint_classes = {}  # Track all classes generated for this endpoint
+    oneof_base_by_schema, class_name_by_schema = schema_lookup_tables(schemas)
 
     # Process request body
     if request_schema and request_schema in schemas:
@@ -1166,40 +1319,42 @@ def process_endpoint(endpoint_name, request_schema, response_schemas, schemas, o
         all_schemas_for_endpoint.update(deps)
 
         # Generate classes
-        generated = set()
-        for schema_name in sorted(deps):
-            if schema_name in generated:
-                continue
+        with _directory_fd(body_dir) as dir_fd:
+            generated = set()
+            # Sources to write keyed by path, so a class produced twice is written once
+            pending = {}
+            sorted_deps = sorted(deps)
+            class_codes = render_schema_classes(sorted_deps, schemas, package, enable_javadoc, enable_imports)
+            for schema_name, class_code in zip(sorted_deps, class_codes):
+                if schema_name in generated:
+                    continue
 
-            # Check for oneOf base class
-            oneof_field, oneof_types = has_oneof_field(schema_name, schemas)
-            if oneof_field and oneof_types:
-                base_name = to_java_class_name(oneof_field)
-                if base_name not in generated:
+                # Check for oneOf base class
+                base_name = oneof_base_by_schema.get(schema_name)
+                if base_name is not None and base_name not in generated:
                     java_code = generate_base_class_for_oneof(base_name, package, enable_javadoc)
                     filepath = os.path.join(body_dir, f"{base_name}.java")
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(java_code)
+                    pending[filepath] = java_code
                     generated.add(base_name)
                     endpoint_classes[base_name] = filepath
 
-            java_code = generate_java_class_from_schema(schema_name, schemas, package, enable_javadoc=enable_javadoc, enable_imports=enable_imports)
-            if java_code:
-                filepath = os.path.join(body_dir, f"{to_java_class_name(schema_name)}.java")
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(java_code)
-                generated.add(schema_name)
-                endpoint_classes[to_java_class_name(schema_name)] = filepath
-
-        # Generate inline classes
-        for schema_name in sorted(deps):
-            inline_generated = generate_inline_classes(schema_name, schemas, package, body_dir)
-            generated.update(inline_generated)
-            # Track inline classes
-            for inline_class in inline_generated:
-                inline_filepath = os.path.join(body_dir, f"{to_java_class_name(inline_class)}.java")
-                if os.path.exists(inline_filepath):
-                    endpoint_classes[to_java_class_name(inline_class)] = inline_filepath
+                if class_code:
+                    class_name = class_name_by_schema[schema_name]
+                    filepath = os.path.join(body_dir, f"{class_name}.java")
+                    pending[filepath] = class_code
+                    generated.add(schema_name)
+                    endpoint_classes[class_name] = filepath
+
+            # Generate inline classes
+            for schema_name in sorted_deps:
+                for inline_class, java_code in render_inline_classes(schema_name, schemas, package):
+                    inline_filepath = os.path.join(body_dir, f"{inline_class}.java")
+                    pending[inline_filepath] = java_code
+                    generated.add(inline_class)
+                    # Track inline classes
+                    endpoint_classes[inline_class] = inline_filepath
+
+            _flush_writes(pending, dir_fd)
 
         print(f"      ✅ Generated {len(generated)} classes for request")
 
@@ -1229,40 +1384,42 @@ def process_endpoint(endpoint_name, request_schema, response_schemas, schemas, o
         all_schemas_for_endpoint.update(deps)
 
         # Generate classes
-        generated = set()
-        for schema_name in sorted(deps):
-            if schema_name in generated:
-                continue
+        with _directory_fd(response_dir) as dir_fd:
+            generated = set()
+            # Sources to write keyed by path, so a class produced twice is written once
+            pending = {}
+            sorted_deps = sorted(deps)
+            class_codes = render_schema_classes(sorted_deps, schemas, package, enable_javadoc, enable_imports)
+            for schema_name, class_code in zip(sorted_deps, class_codes):
+                if schema_name in generated:
+                    continue
 
-            # Check for oneOf base class
-            oneof_field, oneof_types = has_oneof_field(schema_name, schemas)
-            if oneof_field and oneof_types:
-                base_name = to_java_class_name(oneof_field)
-                if base_name not in generated:
+                # Check for oneOf base class
+                base_name = oneof_base_by_schema.get(schema_name)
+                if base_name is not None and base_name not in generated:
                     java_code = generate_base_class_for_oneof(base_name, package, enable_javadoc)
                     filepath = os.path.join(response_dir, f"{base_name}.java")
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(java_code)
+                    pending[filepath] = java_code
                     generated.add(base_name)
                     endpoint_classes[base_name] = filepath
 
-            java_code = generate_java_class_from_schema(schema_name, schemas, package, enable_javadoc=enable_javadoc, enable_imports=enable_imports)
-            if java_code:
-                filepath = os.path.join(response_dir, f"{to_java_class_name(schema_name)}.java")
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(java_code)
-                generated.add(schema_name)
-                endpoint_classes[to_java_class_name(schema_name)] = filepath
-
-        # Generate inline classes
-        for schema_name in sorted(deps):
-            inline_generated = generate_inline_classes(schema_name, schemas, package, response_dir)
-            generated.update(inline_generated)
-            # Track inline classes
-            for inline_class in inline_generated:
-                inline_filepath = os.path.join(response_dir, f"{to_java_class_name(inline_class)}.java")
-                if os.path.exists(inline_filepath):
-                    endpoint_classes[to_java_class_name(inline_class)] = inline_filepath
+                if class_code:
+                    class_name = class_name_by_schema[schema_name]
+                    filepath = os.path.join(response_dir, f"{class_name}.java")
+                    pending[filepath] = class_code
+                    generated.add(schema_name)
+                    endpoint_classes[class_name] = filepath
+
+            # Generate inline classes
+            for schema_name in sorted_deps:
+                for inline_class, java_code in render_inline_classes(schema_name, schemas, package):
+                    inline_filepath = os.path.join(response_dir, f"{inline_class}.java")
+                    pending[inline_filepath] = java_code
+                    generated.add(inline_class)
+                    # Track inline classes
+                    endpoint_classes[inline_class] = inline_filepath
+
+            _flush_writes(pending, dir_fd)
 
         print(f"      ✅ Generated {len(generated)} classes for response")
 
@@ -1280,32 +1437,40 @@ def process_endpoint(endpoint_name, request_schema, response_schemas, schemas, o
 
     return endpoint_classes
 
-def generate_unused_schemas(schemas, output_dir, package, enable_javadoc=True, enable_imports=False):
+def _java_class_names(root_dir, skip_dirs=()):
+    """Yield the class name of every .java file under root_dir, not descending into skip_dirs."""
+    stack = [root_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # DirEntry caches the file type, so no extra stat is needed here
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.java'):
+                    yield entry.name[:-5]  # Remove .java
+
+def generate_unused_schemas(schemas, output_dir, package, enable_javadoc=True, enable_imports=False, used_schemas=None):
     """
     Generate classes for schemas that are not used in any endpoint.
     These are placed in a NO_ENDPOINT folder organized by inheritance.
+
+    used_schemas is the set of class names already generated for endpoints;
+    when omitted it is rebuilt by scanning output_dir.
     """
     # First, find all schemas already generated (used in endpoints)
-    used_schemas = set()
-    for root, dirs, files in os.walk(output_dir):
-        # Skip NO_ENDPOINT folder if it exists
-        if 'NO_ENDPOINT' in root:
-            continue
-        for filename in files:
-            if filename.endswith('.java'):
-                class_name = filename[:-5]  # Remove .java
-                used_schemas.add(class_name)
-
-    # Find schemas that should be generated but are not used
-    unused_schemas = []
-    for schema_name, schema in schemas.items():
-        # Skip array-only schemas
-        if schema.get('type') == 'array' and 'properties' not in schema and 'allOf' not in schema:
-            continue
-
-        class_name = to_java_class_name(schema_name)
-        if class_name not in used_schemas:
-            unused_schemas.append(schema_name)
+    if used_schemas is None:
+        used_schemas = set(_java_class_names(output_dir, ('NO_ENDPOINT',)))
+
+    # Find schemas that should be generated but are not used, skipping array-only schemas,
+    # together with their class name and oneOf base class so generation needs no lookups
+    oneof_base_by_schema, class_name_by_schema = schema_lookup_tables(schemas)
+    unused_schemas = [
+        (schema_name, class_name_by_schema[schema_name], oneof_base_by_schema.get(schema_name))
+        for schema_name, schema in schemas.items()
+        if class_name_by_schema[schema_name] not in used_schemas
+        and not (schema.get('type') == 'array' and 'properties' not in schema and 'allOf' not in schema)
+    ]
 
     if not unused_schemas:
         print("   No unused schemas found")
@@ -1318,41 +1483,60 @@ def generate_unused_schemas(schemas, output_dir, package, enable_javadoc=True, e
     os.makedirs(no_endpoint_dir, exist_ok=True)
 
     # Generate classes for unused schemas
-    generated = set()
-    for schema_name in sorted(unused_schemas):
-        # Check for oneOf base class
-        oneof_field, oneof_types = has_oneof_field(schema_name, schemas)
-        if oneof_field and oneof_types:
-            base_name = to_java_class_name(oneof_field)
-            if base_name not in generated:
+    with _directory_fd(no_endpoint_dir) as dir_fd:
+        generated = set()
+        # Sources to write keyed by path, so a class produced twice is written once
+        pending = {}
+        # Source last written for each class, so organizing needs not read the files back
+        class_sources = {}
+        unused_schemas.sort()
+        class_codes = render_schema_classes([entry[0] for entry in unused_schemas], schemas, package, enable_javadoc, enable_imports)
+        for (schema_name, class_name, base_name), class_code in zip(unused_schemas, class_codes):
+            # Check for oneOf base class
+            if base_name is not None and base_name not in generated:
                 java_code = generate_base_class_for_oneof(base_name, package, enable_javadoc)
                 filepath = os.path.join(no_endpoint_dir, f"{base_name}.java")
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(java_code)
+                pending[filepath] = java_code
                 generated.add(base_name)
+                class_sources[base_name] = java_code
 
-        java_code = generate_java_class_from_schema(schema_name, schemas, package, enable_javadoc=enable_javadoc, enable_imports=enable_imports)
-        if java_code:
-            filepath = os.path.join(no_endpoint_dir, f"{to_java_class_name(schema_name)}.java")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(java_code)
-            generated.add(schema_name)
+            if class_code:
+                filepath = os.path.join(no_endpoint_dir, f"{class_name}.java")
+                pending[filepath] = class_code
+                generated.add(schema_name)
+                class_sources[class_name] = class_code
 
-        # Generate inline classes for this schema
-        inline_generated = generate_inline_classes(schema_name, schemas, package, no_endpoint_dir)
-        generated.update(inline_generated)
+            # Generate inline classes for this schema
+            for inline_class_name, java_code in render_inline_classes(schema_name, schemas, package):
+                filepath = os.path.join(no_endpoint_dir, f"{inline_class_name}.java")
+                pending[filepath] = java_code
+                generated.add(inline_class_name)
+                class_sources[inline_class_name] = java_code
+
+        _flush_writes(pending, dir_fd)
 
     print(f"   ✅ Generated {len(generated)} classes in NO_ENDPOINT/")
 
     # Organize by inheritance
-    organize_no_endpoint_by_inheritance(no_endpoint_dir, schemas)
+    organize_no_endpoint_by_inheritance(no_endpoint_dir, schemas, class_sources)
     print(f"   📂 Organized by inheritance")
 
-def organize_no_endpoint_by_inheritance(no_endpoint_dir, schemas):
+def _move_if_present(src, dest):
+    """Move src to dest, ignoring a src that was already moved into another family."""
+    try:
+        os.replace(src, dest)
+    except FileNotFoundError:
+        pass
+
+def organize_no_endpoint_by_inheritance(no_endpoint_dir, schemas, class_sources=None):
     """
     Organize NO_ENDPOINT folder by inheritance relationships.
+
+    class_sources optionally maps class names to the Java source just written
+    for them; classes missing from it are read back from disk.
     """
-    import shutil
+    if class_sources is None:
+        class_sources = {}
 
     # Analyze all files in NO_ENDPOINT
     class_info = {}
@@ -1361,20 +1545,20 @@ def organize_no_endpoint_by_inheritance(no_endpoint_dir, schemas):
             continue
 
         class_name = filename[:-5]
-        filepath = os.path.join(no_endpoint_dir, filename)
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = class_sources.get(class_name)
+        if content is None:
+            filepath = os.path.join(no_endpoint_dir, filename)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
 
         # Extract extends
-        extends_match = re.search(r'extends\s+(\w+)', content)
+        extends_match = _EXTENDS_RE.search(content)
         extends = extends_match.group(1) if extends_match else None
 
         class_info[class_name] = {
             'filename': filename,
             'extends': extends,
-            'children': [],
-            'content': content
+            'children': []
         }
 
     # Build children relationships
@@ -1390,32 +1574,28 @@ def organize_no_endpoint_by_inheritance(no_endpoint_dir, schemas):
 
     # Organize files: group by inheritance
     processed = set()
+    families = []
 
-    # First, handle inheritance groups (base class + children)
+    # First, plan inheritance groups (base class + children)
     for class_name, info in class_info.items():
         if class_name in processed:
             continue
 
-        # If this class has children, create a subfolder for the family
+        # If this class has children, it gets a subfolder for the family
         if info['children']:
-            family_dir = os.path.join(no_endpoint_dir, to_camel_case(class_name))
-            os.makedirs(family_dir, exist_ok=True)
+            members = [class_name] + info['children']
+            families.append((os.path.join(no_endpoint_dir, to_camel_case(class_name)), members))
+            processed.update(members)
 
-            # Move base class
-            src = os.path.join(no_endpoint_dir, info['filename'])
-            dest = os.path.join(family_dir, info['filename'])
-            if os.path.exists(src):
-                shutil.move(src, dest)
-            processed.add(class_name)
+    # Create every family folder once, before any file is moved
+    for family_dir, members in families:
+        os.makedirs(family_dir, exist_ok=True)
 
-            # Move children
-            for child_name in info['children']:
-                child_info = class_info[child_name]
-                src = os.path.join(no_endpoint_dir, child_info['filename'])
-                dest = os.path.join(family_dir, child_info['filename'])
-                if os.path.exists(src):
-                    shutil.move(src, dest)
-                processed.add(child_name)
+    # Move each base class followed by its children
+    for family_dir, members in families:
+        for member in members:
+            filename = class_info[member]['filename']
+            _move_if_present(os.path.join(no_endpoint_dir, filename), os.path.join(family_dir, filename))
 
 def update_file_packages(output_dir, base_package, enable_imports, detect_package):
     """
@@ -1456,11 +1636,9 @@ def update_file_packages(output_dir, base_package, enable_imports, detect_packag
             correct_package = get_package_for_file(filepath, base_package, output_dir, detect_package)
 
             # Replace package declaration
-            content = re.sub(r'^package\s+[\w.]+;', f'package {correct_package};', content, flags=re.MULTILINE)
+            content = _PACKAGE_RE.sub(f'package {correct_package};', content)
 
             # Update imports: replace base_package.ClassName with correct_package.ClassName
-            # Find all import statements
-            import_pattern = r'import\s+([\w.]+)\.([\w]+);'
 
             def replace_import(match):
                 full_package = match.group(1)
@@ -1473,7 +1651,7 @@ def update_file_packages(output_dir, base_package, enable_imports, detect_packag
                     # Keep original import (for java.util, lombok, etc.)
                     return match.group(0)
 
-            content = re.sub(import_pattern, replace_import, content)
+            content = _IMPORT_RE.sub(replace_import, content)
 
             # Write back
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -1520,11 +1698,9 @@ def update_endpoint_packages(endpoint_dir, endpoint_classes, base_package, outpu
             correct_package = get_package_for_file(filepath, base_package, output_dir, detect_package)
 
             # Replace package declaration
-            content = re.sub(r'^package\s+[\w.]+;', f'package {correct_package};', content, flags=re.MULTILINE)
+            content = _PACKAGE_RE.sub(f'package {correct_package};', content)
 
             # Update imports: replace base_package.ClassName with correct_package.ClassName
-            # Find all import statements
-            import_pattern = r'import\s+([\w.]+)\.([\w]+);'
 
             def replace_import(match):
                 full_package = match.group(1)
@@ -1537,7 +1713,7 @@ def update_endpoint_packages(endpoint_dir, endpoint_classes, base_package, outpu
                     # Keep original import (for java.util, lombok, etc.)
                     return match.group(0)
 
-            content = re.sub(import_pattern, replace_import, content)
+            content = _IMPORT_RE.sub(replace_import, content)
 
             # Remove imports of classes that are in the same package as the current file
             # Split content into lines to process imports
@@ -1556,7 +1732,7 @@ def update_endpoint_packages(endpoint_dir, endpoint_classes, base_package, outpu
 
             for i, line in enumerate(lines):
                 # Check if this is an import statement
-                import_match = re.match(r'import\s+([\w.]+)\.([\w]+);', line)
+                import_match = _IMPORT_RE.match(line)
                 if import_match:
                     import_package = import_match.group(1)
                     imported_class = import_match.group(2)
@@ -1588,89 +1764,132 @@ def update_endpoint_packages(endpoint_dir, endpoint_classes, base_package, outpu
         print(f"      🔄 Updated {updated_count} files with endpoint-specific packages and imports")
 
 
+# Operations that get request/response classes generated
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'patch', 'delete'})
+
+def _json_schema_ref(container):
+    """Return the schema name referenced by a request body or response's JSON content, or None."""
+    json_content = container.get('content', {}).get('application/json')
+    if not json_content:
+        return None
+    schema_ref = json_content.get('schema', {}).get('$ref')
+    return _ref_name(schema_ref) if schema_ref is not None else None
+
+# Background threads started by _discard_directory that may still be running
+_discard_threads = []
+
+def _discard_directory(path):
+    """Move a directory out of the way and delete it on a background thread.
+
+    The thread is not a daemon, so the interpreter still finishes the deletion
+    before exiting instead of leaving the renamed directory behind. Call
+    _finish_discards before forking worker processes.
+    """
+    trash_dir = f"{path}.old.{os.getpid()}"
+    try:
+        os.rename(path, trash_dir)
+    except OSError:
+        # Renaming can fail (e.g. a file held open on Windows); delete in place
+        shutil.rmtree(path)
+        return
+
+    thread = threading.Thread(target=shutil.rmtree, args=(trash_dir,), kwargs={'ignore_errors': True})
+    thread.start()
+    _discard_threads.append(thread)
+
+def _finish_discards():
+    """Wait for background directory deletions, so no thread is running across a fork."""
+    while _discard_threads:
+        _discard_threads.pop().join()
+
 def process_openapi_definition(openapi_file, output_dir, package, enable_javadoc, enable_imports, detect_package):
     """Process a single OpenAPI definition file and generate Java classes."""
 
     # Load OpenAPI
-    with open(openapi_file, 'r', encoding='utf-8') as f:
-        openapi_spec = yaml.safe_load(f)
+    openapi_spec = load_openapi_spec(openapi_file)
 
     schemas = openapi_spec.get('components', {}).get('schemas', {})
     print(f"Loaded {len(schemas)} schemas from OpenAPI\n")
 
     # Clear output directory
     if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
+        _discard_directory(output_dir)
     os.makedirs(output_dir)
 
     # Extract endpoints
     paths = openapi_spec.get('paths', {})
     responses_comp = openapi_spec.get('components', {}).get('responses', {})
 
-    endpoint_count = 0
+    # Endpoints with a request or response body, as process_endpoint arguments
+    endpoints = []
     for path, path_item in paths.items():
+        # Generate endpoint name suffix, shared by every method of this path
+        endpoint_parts = [p for p in path.split('/') if p and not p.startswith('{')]
+        endpoint_suffix = '_'.join(endpoint_parts) if endpoint_parts else 'root'
+
         for method, operation in path_item.items():
-            if method not in ['get', 'post', 'put', 'patch', 'delete']:
+            if method not in _HTTP_METHODS:
                 continue
 
-            # Generate endpoint name
-            endpoint_parts = [p for p in path.split('/') if p and not p.startswith('{')]
-            endpoint_name = f"{method.upper()}_{'_'.join(endpoint_parts)}" if endpoint_parts else f"{method.upper()}_root"
+            endpoint_name = f"{method.upper()}_{endpoint_suffix}"
 
             # Extract request schema
-            request_schema = None
-            request_body = operation.get('requestBody', {})
-            if request_body:
-                content = request_body.get('content', {})
-                json_content = content.get('application/json', {})
-                schema = json_content.get('schema', {})
-                if '$ref' in schema:
-                    request_schema = schema['$ref'].split('/')[-1]
+            request_body = operation.get('requestBody')
+            request_schema = _json_schema_ref(request_body) if request_body else None
 
             # Extract response schemas
             response_schemas = []
-            responses = operation.get('responses', {})
-            for status_code, response in responses.items():
-                if status_code.startswith('2'):
-                    if '$ref' in response:
-                        ref_name = response['$ref'].split('/')[-1]
-                        if ref_name in responses_comp:
-                            resp_content = responses_comp[ref_name].get('content', {})
-                            json_content = resp_content.get('application/json', {})
-                            schema = json_content.get('schema', {})
-                            if '$ref' in schema:
-                                response_schemas.append(schema['$ref'].split('/')[-1])
-                    else:
-                        resp_content = response.get('content', {})
-                        json_content = resp_content.get('application/json', {})
-                        schema = json_content.get('schema', {})
-                        if '$ref' in schema:
-                            response_schemas.append(schema['$ref'].split('/')[-1])
+            for status_code, response in operation.get('responses', {}).items():
+                if not status_code.startswith('2'):
+                    continue
+                if '$ref' in response:
+                    response = responses_comp.get(_ref_name(response['$ref']))
+                    if response is None:
+                        continue
+                schema_ref = _json_schema_ref(response)
+                if schema_ref is not None:
+                    response_schemas.append(schema_ref)
 
-            # Process endpoint
             if request_schema or response_schemas:
-                endpoint_classes = process_endpoint(endpoint_name, request_schema, response_schemas, schemas, output_dir, package, enable_javadoc, enable_imports, detect_package, output_dir)
-                # Update packages for this endpoint using only its classes
-                endpoint_dir = os.path.join(output_dir, endpoint_name)
-                update_endpoint_packages(endpoint_dir, endpoint_classes, package, output_dir, detect_package)
-                endpoint_count += 1
+                endpoints.append((endpoint_name, request_schema, response_schemas))
+
+    # Render the classes of every endpoint as one batch, so large definitions use the
+    # process pool once instead of rendering each endpoint's few classes serially.
+    # Endpoints are then written one after another, keeping filesystem changes in this process.
+    endpoint_schemas = set()
+    for _, request_schema, response_schemas in endpoints:
+        for root_schema in (request_schema, *response_schemas):
+            if root_schema in schemas:
+                endpoint_schemas.update(get_all_schema_dependencies(root_schema, schemas))
+    render_schema_classes(sorted(endpoint_schemas), schemas, package, enable_javadoc, enable_imports)
+
+    endpoint_count = 0
+    # Class names written for endpoints, so unused schemas need no directory scan
+    used_classes = set()
+    for endpoint_name, request_schema, response_schemas in endpoints:
+        endpoint_classes = process_endpoint(endpoint_name, request_schema, response_schemas, schemas, output_dir, package, enable_javadoc, enable_imports, detect_package, output_dir)
+        used_classes.update(endpoint_classes)
+        # Update packages for this endpoint using only its classes
+        endpoint_dir = os.path.join(output_dir, endpoint_name)
+        update_endpoint_packages(endpoint_dir, endpoint_classes, package, output_dir, detect_package)
+        endpoint_count += 1
 
     print(f"\n✅ Processed {endpoint_count} endpoints")
     print(f"   Generated classes in: {output_dir}/")
 
     # Generate unused schemas in NO_ENDPOINT folder
     print(f"\n📦 Processing unused schemas...")
-    generate_unused_schemas(schemas, output_dir, package, enable_javadoc, enable_imports)
+    generate_unused_schemas(schemas, output_dir, package, enable_javadoc, enable_imports, used_classes)
 
 def to_camel_case(name):
     """Convert PascalCase or snake_case to camelCase for folder names."""
     # If it's already PascalCase, convert first letter to lowercase
-    if re.match(r'^[A-Z][a-zA-Z0-9]*$', name):
+    if _is_upper_camel(name):
         return name[0].lower() + name[1:]
 
     # Otherwise, handle snake_case or mixed
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-    parts = re.split(r'[_\s-]+', name)
+    name = _NON_IDENT.sub('_', name)
+    parts = _SPLIT.split(name)
     if not parts:
         return name
     return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:] if word)
@@ -1698,7 +1917,7 @@ def extract_parent_class_from_java(file_path):
 
         # Look for "public class ClassName extends ParentClass"
         # or "public abstract class ClassName extends ParentClass"
-        match = re.search(r'public\s+(?:abstract\s+)?class\s+\w+\s+extends\s+(\w+)', content)
+        match = _PARENT_CLASS_RE.search(content)
         if match:
             return match.group(1)
     except Exception:
@@ -1732,12 +1951,10 @@ def build_inheritance_map_from_files(output_dir, schema_names):
 def update_package_in_file(file_content, new_package):
     """Update the package declaration in a Java file."""
     # Replace the package declaration
-    updated_content = re.sub(
-        r'^package\s+[\w.]+;',
+    updated_content = _PACKAGE_RE.sub(
         f'package {new_package};',
         file_content,
-        count=1,
-        flags=re.MULTILINE
+        count=1
     )
     return updated_content
 
@@ -1827,11 +2044,7 @@ def copy_inheritance_hierarchy(class_name, output_dir, all_schemas_dir, base_pac
         # Keep original import (for external classes)
         return full_import
 
-    updated_content = re.sub(
-        r'import\s+([\w.]+)\.([\w]+);',
-        update_import,
-        updated_content
-    )
+    updated_content = _IMPORT_RE.sub(update_import, updated_content)
 
     # Write the updated file
     with open(dest_file, 'w', encoding='utf-8') as f:
@@ -1845,8 +2058,7 @@ def copy_inheritance_hierarchy(class_name, output_dir, all_schemas_dir, base_pac
 
 def generate_all_schemas_java(openapi_file, output_dir, package, enable_javadoc, enable_imports):
     """Generate ALL_SCHEMAS folder by copying and organizing existing classes from endpoints."""
-    with open(openapi_file, 'r', encoding='utf-8') as f:
-        openapi_spec = yaml.safe_load(f)
+    openapi_spec = load_openapi_spec(openapi_file)
 
     schemas = openapi_spec.get('components', {}).get('schemas', {})
     if not schemas:
@@ -1862,18 +2074,8 @@ def generate_all_schemas_java(openapi_file, output_dir, package, enable_javadoc,
 
     # Scan all generated Java files to find ALL classes (including inline classes)
     print(f"   🔍 Scanning all generated Java files...")
-    all_generated_classes = set()
-
     # Exclude ALL_SCHEMAS and NO_ENDPOINT folders from scan
-    for root, dirs, files in os.walk(output_dir):
-        # Skip ALL_SCHEMAS and NO_ENDPOINT folders
-        if 'ALL_SCHEMAS' in root or 'NO_ENDPOINT' in root:
-            continue
-
-        for file in files:
-            if file.endswith('.java'):
-                class_name = file[:-5]  # Remove .java extension
-                all_generated_classes.add(class_name)
+    all_generated_classes = set(_java_class_names(output_dir, ('ALL_SCHEMAS', 'NO_ENDPOINT')))
 
     print(f"   Found {len(all_generated_classes)} unique classes in endpoint folders")
 
@@ -1985,7 +2187,7 @@ def generate_all_schemas_java(openapi_file, output_dir, package, enable_javadoc,
                 # Keep original import
                 return full_import
 
-            content = re.sub(r'import\s+([\w.]+)\.([\w]+);', update_import_to_all_schemas, content)
+            content = _IMPORT_RE.sub(update_import_to_all_schemas, content)
 
             # Only write if content changed
             if content != original_content:
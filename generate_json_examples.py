@@ -1,7 +1,7 @@
 import json
-import yaml
 import os
 from datetime import datetime
+from config import load_openapi_spec
 
 
 def extract_endpoints_from_openapi(openapi_definition):
@@ -100,10 +100,9 @@ def extract_refs_from_properties(properties, schemas, visited):
 
 
 def load_openapi_definition(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        if file_path.endswith('.json'):
-            return json.load(file)
-        return yaml.safe_load(file)
+    # JSON documents are detected by content and parsed with orjson when available;
+    # repeated loads of the same file come from the shared spec cache
+    return load_openapi_spec(file_path)
 
 
 def extract_schemas(openapi_definition):
@@ -251,8 +250,7 @@ def process_schema(schema_name, schemas, endpoint_dir, folder_name):
 
 def generate_all_schemas_folder(openapi_file, output_folder):
     """Generate ALL_SCHEMAS folder with unique schemas organized by inheritance."""
-    with open(openapi_file, 'r', encoding='utf-8') as f:
-        openapi_definition = yaml.safe_load(f)
+    openapi_definition = load_openapi_definition(openapi_file)
 
     schemas = openapi_definition.get('components', {}).get('schemas', {})
     if not schemas:
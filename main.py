@@ -41,6 +41,9 @@ def main():
         print(f"❌ Error generating JSON examples:")
         print(result.stderr)
         return
+    if result.stderr:
+        # Warnings logged by a step that still succeeded
+        print(result.stderr)
 
     # Generate Java classes directly from OpenAPI schema
     print(f"\n{'='*70}")
@@ -52,6 +55,9 @@ def main():
         print(f"❌ Error generating Java classes:")
         print(result.stderr)
         return
+    if result.stderr:
+        # Warnings logged by a step that still succeeded
+        print(result.stderr)
 
     # Generate Feign clients
     print(f"\n{'='*70}")
@@ -63,6 +69,9 @@ def main():
         print(f"❌ Error generating Feign clients:")
         print(result.stderr)
         return
+    if result.stderr:
+        # Warnings logged by a step that still succeeded
+        print(result.stderr)
 
     print(f"\n{'='*70}")
     print("✅ Process complete!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Java identifier conversion helpers for the Feign client generator.
+Kept free of other project imports so the module can be compiled on its own
+(e.g. `mypyc name_utils.py`) without changing how it is imported.
+"""
+import functools
+import re
+
+# Identifier patterns used by the name converters below
+_UPPER_CAMEL = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+_LOWER_CAMEL = re.compile(r'^[a-z][a-zA-Z0-9]*$')
+_NON_IDENT = re.compile(r'[^a-zA-Z0-9_]')
+_SPLIT = re.compile(r'[_\s-]+')
+
+# Maps every Latin-1 character that _NON_IDENT would replace to an underscore
+_IDENT_TRANS = str.maketrans({
+    chr(code): '_' for code in range(256)
+    if not (chr(code).isascii() and (chr(code).isalnum() or chr(code) == '_'))
+})
+
+@functools.lru_cache(maxsize=4096)
+def to_java_class_name(name):
+    """Convert string to Java class name."""
+    if _UPPER_CAMEL.match(name):
+        return name
+    if _LOWER_CAMEL.match(name):
+        return name[0].upper() + name[1:]
+    name = _NON_IDENT.sub('_', name)
+    parts = _SPLIT.split(name)
+    return ''.join(word.capitalize() for word in parts if word)
+
+@functools.lru_cache(maxsize=4096)
+def to_java_method_name(operation_id):
+    """Convert operationId to Java method name."""
+    if not operation_id:
+        return "execute"
+    # If already in camelCase, keep it
+    if _LOWER_CAMEL.match(operation_id):
+        return operation_id
+    # Convert to camelCase
+    name = _NON_IDENT.sub('_', operation_id)
+    parts = _SPLIT.split(name)
+    if not parts:
+        return operation_id
+    return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:] if word)
+
+@functools.lru_cache(maxsize=4096)
+def to_java_param_name(name):
+    """Convert parameter name to valid Java identifier (camelCase), preserving internal camelCase."""
+    if not name:
+        return "param"
+    # If already valid camelCase, keep it
+    if _LOWER_CAMEL.match(name):
+        return name
+
+    # Split by hyphens, underscores, spaces and any other non-identifier
+    # characters while preserving camelCase within parts: map them all to
+    # underscores in one pass for uniform splitting
+    name = name.translate(_IDENT_TRANS)
+    if not name.isascii():
+        # Characters beyond the translation table
+        name = _NON_IDENT.sub('_', name)
+    parts = [part for part in name.split('_') if part]
+
+    if not parts:
+        return "param"
+
+    # First part should be lowercase, rest should preserve their camelCase or capitalize if all lowercase
+    result_parts = []
+    for i, part in enumerate(parts):
+        if i == 0:
+            # First part: convert to lowercase
+            result_parts.append(part.lower())
+        else:
+            # Subsequent parts: preserve if already has uppercase (camelCase), otherwise capitalize first letter
+            if any(c.isupper() for c in part):
+                # Has uppercase letters - preserve as is (e.g., "applicationId" stays "applicationId")
+                # But ensure first letter is uppercase for concatenation
+                result_parts.append(part[0].upper() + part[1:] if part else '')
+            else:
+                # All lowercase - capitalize first letter
+                result_parts.append(part.capitalize())
+
+    return ''.join(result_parts)